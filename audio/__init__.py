@@ -1,3 +1,5 @@
 from .sound_manager import SoundManager, AudioFactory
+from .voice_manager import VoiceManager
+from .music import MusicStream
 
-__all__ = ['SoundManager', 'AudioFactory']
\ No newline at end of file
+__all__ = ['SoundManager', 'AudioFactory', 'VoiceManager', 'MusicStream']
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Procedural chiptune music
+A step sequencer synthesizes PCM one step at a time on a background thread
+"""
+import pygame
+import queue
+import threading
+import numpy as np
+from config import Config
+from audio.sound_manager import AudioFactory
+
+
+class MusicStream:
+    """Looping chiptune fed chunk by chunk to one dedicated mixer channel
+    
+    The synth thread renders one sixteenth-note step per chunk into a bounded
+    queue and blocks while it is full, so memory is constant and a tempo change
+    is heard within a queue's worth of steps. update() on the main loop only hands
+    finished chunks to the channel; a chunk missing when the channel runs dry
+    is counted as an underrun.
+    """
+    
+    # A minor: i - VI - III - VII, one chord per bar of 16 steps
+    ROOT_HZ = 110.0
+    CHORDS = (0, 8, 3, 10)
+    ARPEGGIO = (0, 7, 12, 15, 12, 7)
+    STEPS_PER_BAR = 16
+    
+    MIN_BPM = 100
+    MAX_BPM = 170
+    
+    # Voice -> (wave, gain); hats are short noise bursts on the off-beats
+    BASS = ("triangle", 0.45)
+    LEAD = ("square", 0.18)
+    HAT = ("noise", 0.08)
+    
+    def __init__(self, channel, volume=Config.MUSIC_VOLUME, queue_chunks=Config.MUSIC_QUEUE_CHUNKS):
+        self.channel = channel
+        self.channel.set_volume(volume)
+        self.mixer = pygame.mixer.get_init() or (AudioFactory.SAMPLE_RATE, -16, 1)
+        self.chunks = queue.Queue(maxsize=queue_chunks)
+        self.bpm = self.MIN_BPM
+        self.rng = np.random.default_rng()
+        
+        self.step = 0
+        self.played = 0
+        self.underruns = 0
+        self.started = False
+        
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self._synth_loop, name="music-synth", daemon=True)
+    
+    def start(self):
+        self.thread.start()
+    
+    def follow(self, intensity):
+        """Set the tempo from a 0..1 intensity; picked up by the next step synthesized"""
+        intensity = min(max(intensity, 0.0), 1.0)
+        self.bpm = self.MIN_BPM + (self.MAX_BPM - self.MIN_BPM) * intensity
+    
+    # Synthesis (music thread)
+    
+    def _synth_loop(self):
+        while not self.stopping.is_set():
+            chunk = self._render_step(self.step, self.bpm)
+            self.step += 1
+            while not self.stopping.is_set():
+                try:
+                    self.chunks.put(chunk, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+    
+    def _note(self, wave_type, semitones, gain, n_samples, length=1.0):
+        """One enveloped note starting at the step boundary"""
+        sample_rate = self.mixer[0]
+        frequency = self.ROOT_HZ * 2 ** (semitones / 12)
+        phase = np.arange(n_samples) * (frequency / sample_rate)
+        wave = AudioFactory.oscillator(wave_type, phase, self.rng)
+        sounding = max(1, int(n_samples * length))
+        env = np.zeros(n_samples)
+        env[:sounding] = AudioFactory.envelope(sounding, sample_rate)
+        return wave * env * gain
+    
+    def _render_step(self, step, bpm):
+        """16-bit PCM for one step of the pattern at `bpm`"""
+        sample_rate, _, channels = self.mixer
+        n = int(sample_rate * 60 / bpm / 4)
+        bar, beat = divmod(step, self.STEPS_PER_BAR)
+        chord = self.CHORDS[bar % len(self.CHORDS)]
+        
+        mix = np.zeros(n)
+        if beat % 2 == 0:
+            # Bass on every eighth, dropping an octave on the beat
+            octave = -12 if beat % 4 == 0 else 0
+            mix += self._note(self.BASS[0], chord + octave, self.BASS[1], n)
+        arp = self.ARPEGGIO[step % len(self.ARPEGGIO)]
+        mix += self._note(self.LEAD[0], chord + 12 + arp, self.LEAD[1], n, 0.7)
+        if beat % 4 == 2:
+            mix += self._note(self.HAT[0], 0, self.HAT[1], n, 0.25)
+        
+        pcm = (np.clip(mix, -1.0, 1.0) * 32767).astype(np.int16)
+        if channels > 1:
+            pcm = np.repeat(pcm[:, None], channels, axis=1)
+        return pcm
+    
+    # Playback (main loop)
+    
+    def update(self):
+        """Keep a chunk queued behind the one playing; call once per frame"""
+        if self.channel.get_queue() is not None:
+            return
+        
+        if self.started and not self.channel.get_busy():
+            # Ran dry before the next chunk was handed over: an audible gap
+            self.underruns += 1
+            self.started = False
+        
+        try:
+            chunk = self.chunks.get_nowait()
+        except queue.Empty:
+            return
+        
+        sound = pygame.mixer.Sound(buffer=chunk)
+        if self.started:
+            self.channel.queue(sound)
+        else:
+            self.channel.play(sound)
+            self.started = True
+        self.played += 1
+    
+    def stop(self):
+        self.stopping.set()
+        if self.thread.is_alive():
+            self.thread.join()
+        self.channel.stop()
\ No newline at end of file
@@ -2,63 +2,157 @@
 Audio generation and management
 """
 import pygame
-import math
-import random
-import array
+import numpy as np
+from core.bake_cache import default_bake_cache
+from audio.voice_manager import VoiceManager
 
 
 class AudioFactory:
     
+    SAMPLE_RATE = 44100
+    
+    # PCM memoized by (parameters, mixer format)
+    _pcm_cache = {}
+    
+    @staticmethod
+    def oscillator(wave_type, phase, rng):
+        """Evaluate a waveform for an array of phases (in cycles)"""
+        if wave_type == "sine":
+            return np.sin(2 * np.pi * phase)
+        elif wave_type == "square":
+            return np.where(np.sin(2 * np.pi * phase) > 0, 1.0, -1.0)
+        elif wave_type == "saw":
+            return 2.0 * (phase - np.floor(phase + 0.5))
+        elif wave_type == "triangle":
+            return 1.0 - 4.0 * np.abs(phase - np.floor(phase + 0.5))
+        elif wave_type == "noise":
+            return rng.uniform(-1, 1, phase.shape)
+        return np.zeros_like(phase)
+    
     @staticmethod
-    def generate_sound(wave_type="square", frequency=440, duration=0.1, volume=0.5):
-        sample_rate = 44100
+    def envelope(n_samples, sample_rate, adsr=None):
+        """Linear decay by default, or (attack, decay, sustain_level, release) in seconds
+        
+        Segments longer than the sound together are scaled down to fit it.
+        """
+        if adsr is None:
+            return 1.0 - np.arange(n_samples) / n_samples
+        
+        attack, decay, sustain, release = adsr
+        duration = n_samples / sample_rate
+        total = attack + decay + release
+        if total > duration:
+            k = duration / total
+            attack, decay, release = attack * k, decay * k, release * k
+        times = [0.0, attack, attack + decay, duration - release, duration]
+        levels = [0.0, 1.0, sustain, sustain, 0.0]
+        return np.interp(np.arange(n_samples) / sample_rate, times, levels)
+    
+    @staticmethod
+    def synth(wave_type="square", frequency=440, duration=0.1, volume=0.5,
+              envelope=None, sweep_to=None, layers=None, seed=None, sample_rate=SAMPLE_RATE):
+        """Generate a mono waveform as float samples in [-1, 1]
+        
+        layers: ((wave_type, frequency_ratio, gain), ...) mixed on top of the base
+        sweep_to: end frequency of a linear pitch sweep
+        """
         n_samples = int(sample_rate * duration)
-        buf = array.array('h')
+        rng = np.random.default_rng(seed)
         
-        for i in range(n_samples):
-            t = float(i) / sample_rate
-            
-            # Generate waveform
-            if wave_type == "sine":
-                val = math.sin(2 * math.pi * frequency * t)
-            elif wave_type == "square":
-                val = 1.0 if math.sin(2 * math.pi * frequency * t) > 0 else -1.0
-            elif wave_type == "saw":
-                val = 2.0 * (t * frequency - math.floor(t * frequency + 0.5))
-            elif wave_type == "noise":
-                val = random.uniform(-1, 1)
-            else:
-                val = 0
-            
-            # Apply envelope
-            envelope = 1.0 - (i / n_samples)
-            sample = int(val * volume * envelope * 32767)
-            buf.append(sample)
+        # Instantaneous frequency, integrated to phase so sweeps stay continuous
+        if sweep_to is None:
+            phase = np.arange(n_samples) * (frequency / sample_rate)
+        else:
+            freq = np.linspace(frequency, sweep_to, n_samples, endpoint=False)
+            phase = np.cumsum(freq) / sample_rate - freq[0] / sample_rate
         
-        return pygame.mixer.Sound(buffer=buf)
+        val = AudioFactory.oscillator(wave_type, phase, rng)
+        for layer_wave, ratio, gain in layers or ():
+            val = val + gain * AudioFactory.oscillator(layer_wave, phase * ratio, rng)
+        
+        val = np.clip(val, -1.0, 1.0)
+        return val * volume * AudioFactory.envelope(n_samples, sample_rate, envelope)
+    
+    @staticmethod
+    def generate_pcm(*params, mixer=None, **options):
+        """Get 16-bit PCM laid out for a mixer format (default: the active one), memoized"""
+        mixer = mixer or pygame.mixer.get_init() or (AudioFactory.SAMPLE_RATE, -16, 1)
+        sample_rate, _, channels = mixer
+        key = (params, tuple(sorted(options.items())), mixer)
+        
+        pcm = AudioFactory._pcm_cache.get(key)
+        if pcm is None:
+            samples = AudioFactory.synth(*params, sample_rate=sample_rate, **options)
+            pcm = (samples * 32767).astype(np.int16)
+            if channels > 1:
+                pcm = np.repeat(pcm[:, None], channels, axis=1)
+            AudioFactory._pcm_cache[key] = pcm
+        return pcm
+    
+    @staticmethod
+    def generate_sound(*params, **options):
+        """Create a Sound straight from the PCM array buffer (no intermediate copy)"""
+        return pygame.mixer.Sound(buffer=AudioFactory.generate_pcm(*params, **options))
 
 
 class SoundManager:
     
-    def __init__(self):
+    # Requested mixer format: (frequency, size, channels)
+    MIXER = (44100, -16, 1)
+    
+    # Sound effect name -> generate_sound parameters
+    SFX = {
+        'catch': ("square", 880, 0.1, 0.3),
+        'swap': ("sine", 600, 0.05, 0.4),
+        'hurt': ("saw", 150, 0.3, 0.4),
+        'bonus': ("sine", 1200, 0.2, 0.3),
+        'click': ("noise", 500, 0.05, 0.2)
+    }
+    
+    # Sound effect name -> (voice group, priority)
+    VOICES = {
+        'catch': ("player", 1),
+        'swap': ("player", 0),
+        'hurt': ("hazard", 2),
+        'bonus': ("player", 2),
+        'click': ("ui", 0)
+    }
+    
+    # Precomputed (pitch ratio, volume gain) takes of every effect, played in turn
+    VARIANTS = ((1.0, 1.0), (1.06, 0.9), (0.94, 0.95))
+    
+    def __init__(self, preload=True):
         if not pygame.mixer.get_init():
-            pygame.mixer.init(frequency=44100, size=-16, channels=1)
+            frequency, size, channels = self.MIXER
+            pygame.mixer.init(frequency=frequency, size=size, channels=channels)
+        self.voices = VoiceManager()
         
-        # Pre-generate all sound effects
-        self.sfx_catch = AudioFactory.generate_sound("square", 880, 0.1, 0.3)
-        self.sfx_swap = AudioFactory.generate_sound("sine", 600, 0.05, 0.4)
-        self.sfx_hurt = AudioFactory.generate_sound("saw", 150, 0.3, 0.4)
-        self.sfx_bonus = AudioFactory.generate_sound("sine", 1200, 0.2, 0.3)
-        self.sfx_click = AudioFactory.generate_sound("noise", 500, 0.05, 0.2)
+        # Pre-generate all sound effects (loaded from the bake cache when warm),
+        # or leave them to be delivered by the bake pipeline
+        self.sound_map = {name: [None] * len(self.VARIANTS) for name in self.SFX}
+        self.next_variant = dict.fromkeys(self.SFX, 0)
+        if preload:
+            for name, variant, params in self.variant_params():
+                self.set_sound(name, default_bake_cache.sound(AudioFactory.generate_sound, *params), variant)
+    
+    @classmethod
+    def variant_params(cls):
+        """(name, variant, generate_sound parameters) for every take of every effect"""
+        for name, (wave_type, frequency, duration, volume) in cls.SFX.items():
+            for variant, (pitch, gain) in enumerate(cls.VARIANTS):
+                yield name, variant, (wave_type, frequency * pitch, duration, volume * gain)
+    
+    def set_sound(self, name, sound, variant=0):
+        self.sound_map[name][variant] = sound
     
     def play(self, name):
-        sound_map = {
-            'catch': self.sfx_catch,
-            'swap': self.sfx_swap,
-            'hurt': self.sfx_hurt,
-            'bonus': self.sfx_bonus,
-            'click': self.sfx_click
-        }
+        takes = self.sound_map.get(name)
+        if takes is None:
+            return
         
-        if name in sound_map:
-            sound_map[name].play()
\ No newline at end of file
+        variant = self.next_variant[name]
+        self.next_variant[name] = (variant + 1) % len(takes)
+        sound = takes[variant]
+        if sound is not None:
+            group, priority = self.VOICES[name]
+            self.voices.play(name, sound, group, priority)
\ No newline at end of file
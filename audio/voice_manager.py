@@ -0,0 +1,99 @@
+"""
+Voice management on top of pygame.mixer
+Reserved channel groups per category, priority stealing and duplicate-SFX throttling
+"""
+import pygame
+
+
+class VoiceManager:
+    """Plays sounds on reserved mixer channels, one group per category
+    
+    A category only ever uses its own channels, so dense gameplay sounds can
+    not starve UI clicks. When a group is full the lowest-priority, oldest
+    voice is stolen if the new sound matters at least as much; otherwise the
+    new sound is dropped. The same sound requested again within THROTTLE_MS
+    is dropped too, so a burst of hits costs one voice.
+    """
+    
+    # Category -> channels reserved for it; music streams on its own channel
+    GROUPS = {"ui": 1, "player": 3, "hazard": 2, "music": 1}
+    THROTTLE_MS = 60
+    
+    def __init__(self, groups=GROUPS, throttle_ms=THROTTLE_MS):
+        self.throttle_ms = throttle_ms
+        total = sum(groups.values())
+        pygame.mixer.set_num_channels(max(total, pygame.mixer.get_num_channels()))
+        # Keep Sound.play() elsewhere from grabbing the grouped channels
+        pygame.mixer.set_reserved(total)
+        
+        # Group -> channel ids; per channel the priority and start tick of its voice
+        self.groups = {}
+        self.channels = [pygame.mixer.Channel(i) for i in range(total)]
+        self.priority = [0] * total
+        self.started = [0] * total
+        first = 0
+        for name, count in groups.items():
+            self.groups[name] = range(first, first + count)
+            first += count
+        
+        # Sound key -> tick it last started
+        self.last_played = {}
+        
+        self.played = 0
+        self.dropped = 0
+        self.throttled = 0
+        self.stolen = 0
+    
+    def play(self, key, sound, group, priority=0, now=None):
+        """Start `sound` in `group`; returns the channel, or None if dropped
+        
+        key identifies the sound for throttling (variants share their key).
+        """
+        now = pygame.time.get_ticks() if now is None else now
+        last = self.last_played.get(key)
+        if last is not None and now - last < self.throttle_ms:
+            self.throttled += 1
+            self.dropped += 1
+            return None
+        
+        slot = self._free_channel(group)
+        if slot is None:
+            slot = self._victim(group)
+            if self.priority[slot] > priority:
+                self.dropped += 1
+                return None
+            self.stolen += 1
+        
+        channel = self.channels[slot]
+        channel.play(sound)
+        self.priority[slot] = priority
+        self.started[slot] = now
+        self.last_played[key] = now
+        self.played += 1
+        return channel
+    
+    def channel(self, group):
+        """First channel of a group, for a caller that drives it directly"""
+        return self.channels[self.groups[group][0]]
+    
+    def _free_channel(self, group):
+        for slot in self.groups[group]:
+            if not self.channels[slot].get_busy():
+                return slot
+        return None
+    
+    def _victim(self, group):
+        # Lowest priority first, then the voice that has played longest
+        return min(self.groups[group], key=lambda slot: (self.priority[slot], self.started[slot]))
+    
+    def counters(self):
+        return {"played": self.played, "dropped": self.dropped,
+                "throttled": self.throttled, "stolen": self.stolen}
+    
+    def reset_counters(self):
+        self.played = self.dropped = self.throttled = self.stolen = 0
+    
+    def stop(self):
+        """Silence every grouped channel"""
+        for channel in self.channels:
+            channel.stop()
\ No newline at end of file
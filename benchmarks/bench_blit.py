@@ -0,0 +1,53 @@
+"""
+Blit benchmark - generated surfaces as produced vs converted to the display format
+Run from the project root: python -m benchmarks.bench_blit
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import timeit
+import pygame
+from config import Config, TrashType
+from core.asset_factory import AssetFactory
+
+
+def alpha_only(surface):
+    """convert_alpha() without RLE, to show what each step buys"""
+    return surface.convert_alpha()
+
+
+def blit_us(screen, surface, repeat):
+    positions = [((i * 37) % Config.SCREEN_WIDTH, (i * 53) % Config.SCREEN_HEIGHT) for i in range(64)]
+    seq = [(surface, pos) for pos in positions]
+    return timeit.timeit(lambda: screen.blits(seq, False), number=repeat) / (repeat * len(seq)) * 1e6
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+    w, h = Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT
+    sprites = [
+        ("bin 96x96", AssetFactory.create_bin_sprite(Config.GREEN), 500),
+        ("trash 48x48", AssetFactory.create_trash_sprite(TrashType.ORGANIC), 1000),
+        ("button 200x50", AssetFactory.create_button_sprite(200, 50, Config.BLUE), 500),
+        ("cursor", AssetFactory.create_cursor(), 1000),
+    ]
+    
+    print(f"{'sprite':<16}{'raw µs':>10}{'alpha µs':>10}{'alpha+RLE':>11}{'speedup':>9}")
+    for name, raw, repeat in sprites:
+        raw_us = blit_us(screen, raw, repeat)
+        alpha_us = blit_us(screen, alpha_only(raw), repeat)
+        final_us = blit_us(screen, AssetFactory.finalize(raw), repeat)
+        print(f"{name:<16}{raw_us:>10.2f}{alpha_us:>10.2f}{final_us:>11.2f}{raw_us / final_us:>8.1f}x")
+    
+    print(f"\n{'background':<16}{'raw µs':>10}{'opaque µs':>10}{'speedup':>9}")
+    for name, raw in (("menu 800x600", AssetFactory.create_menu_background(w, h)),
+                      ("game 800x600", AssetFactory.create_game_background(w, h))):
+        raw_us = blit_us(screen, raw, 2)
+        final_us = blit_us(screen, AssetFactory.finalize(raw, opaque=True), 2)
+        print(f"{name:<16}{raw_us:>10.1f}{final_us:>10.1f}{raw_us / final_us:>8.1f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
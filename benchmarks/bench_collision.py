@@ -0,0 +1,88 @@
+"""
+Collision benchmark - vectorized per-bin scan vs a Rect test per item
+Run from the project root: python -m benchmarks.bench_collision
+"""
+import random
+import time
+import numpy as np
+import pygame
+from config import Config, TrashType
+from entities.trash import TrashStore
+from managers.collision_manager import CollisionManager
+
+
+class Bin:
+    """Stand-in for Player: only the rect takes part in collision"""
+    
+    def __init__(self, x):
+        self.rect = pygame.Rect(0, 0, Config.BIN_SIZE, Config.BIN_SIZE)
+        self.rect.midbottom = (x, Config.SCREEN_HEIGHT - Config.BIN_FLOOR_GAP)
+
+
+def rect_pairs(store, bins):
+    """Reference: one pygame.Rect per item, tested against each bin in turn"""
+    owners, items = [], []
+    size = Config.TRASH_SIZE
+    rects = [b.rect for b in bins]
+    for i, (x, y) in enumerate(zip(store.x[:store.count].tolist(), store.y[:store.count].tolist())):
+        b = pygame.Rect(x, int(y), size, size).collidelist(rects)
+        if b >= 0:
+            owners.append(b)
+            items.append(i)
+    return np.array(owners, dtype=int), np.array(items, dtype=int)
+
+
+def make_world(num_bins, num_items):
+    store = TrashStore(capacity=num_items)
+    for _ in range(num_items):
+        store.add(TrashType.ORGANIC.value, 0, random.randint(50, Config.SCREEN_WIDTH - 50),
+                  random.uniform(-50, Config.SCREEN_HEIGHT), Config.BASE_TRASH_SPEED)
+    bins = [Bin(random.randint(0, Config.SCREEN_WIDTH)) for _ in range(num_bins)]
+    return store, bins
+
+
+def churn(store, count):
+    """Remove and respawn a few items, as a frame of play would"""
+    store.remove(np.array(random.sample(range(store.count), count)))
+    for _ in range(count):
+        store.add(TrashType.INORGANIC.value, 0, random.randint(50, Config.SCREEN_WIDTH - 50),
+                  -50.0, Config.BASE_TRASH_SPEED)
+
+
+def main(frames=100):
+    collision = CollisionManager()
+    print(f"{'bins':>5}{'items':>7}{'rect ms':>10}{'scan ms':>10}{'hits':>7}{'ns/(b*n)':>10}")
+    for num_bins in (1, 4, 16, 64):
+        for num_items in (100, 1000, 10000):
+            random.seed(num_bins * num_items)
+            store, bins = make_world(num_bins, num_items)
+            
+            rect_s = scan_s = 0.0
+            hits = 0
+            for _ in range(frames):
+                churn(store, max(1, num_items // 100))
+                store.update(Config.SPEED_REF_MS)
+                store.y[store.offscreen()] = -50
+                for b in bins:
+                    b.rect.x = random.randint(0, Config.SCREEN_WIDTH - Config.BIN_SIZE)
+                
+                t0 = time.perf_counter()
+                expected = rect_pairs(store, bins)
+                t1 = time.perf_counter()
+                got = collision.pairs(store, bins)
+                t2 = time.perf_counter()
+                rect_s += t1 - t0
+                scan_s += t2 - t1
+                hits += len(got[1])
+                
+                assert all(np.array_equal(e, g) for e, g in zip(expected, got))
+            
+            rect_ms = rect_s / frames * 1000
+            scan_ms = scan_s / frames * 1000
+            per = scan_ms * 1e6 / (num_bins * num_items)
+            print(f"{num_bins:>5}{num_items:>7}{rect_ms:>10.3f}{scan_ms:>10.3f}"
+                  f"{hits // frames:>7}{per:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""
+Frame cost benchmark - full redraw + flip vs dirty-rect gameplay rendering
+Run from the project root: python -m benchmarks.bench_dirty_rects
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import random
+import time
+import pygame
+from config import Config, GameState, TrashType
+from core.game_manager import GameManager
+
+
+def populate(game, count):
+    """Start a level and scatter live trash over the playfield"""
+    game.start_level(1)
+    game.state = GameState.PLAYING
+    for _ in range(count):
+        game.trash.spawn(random.choice(list(TrashType)), Config.BASE_TRASH_SPEED)
+        game.trash.y[game.trash.count - 1] = random.uniform(-50, Config.SCREEN_HEIGHT - 150)
+
+
+def run_frames(game, frames, dirty):
+    game.present(None)
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.trash.update(Config.SPEED_REF_MS)
+        game.trash.y[game.trash.offscreen()] = -50
+        
+        if dirty and game.dirty_ready:
+            drawn = game.draw_gameplay_dirty()
+        else:
+            game.screen.fill(Config.BLACK)
+            drawn = game.draw_gameplay()
+        game.present(drawn if dirty else None)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main(frames=600):
+    game = GameManager()
+    print(f"{'items':>6}{'full ms':>10}{'dirty ms':>10}{'speedup':>10}")
+    for count in (5, 20, 100):
+        random.seed(count)
+        populate(game, count)
+        full_ms = run_frames(game, frames, dirty=False)
+        dirty_ms = run_frames(game, frames, dirty=True)
+        print(f"{count:>6}{full_ms:>10.3f}{dirty_ms:>10.3f}{full_ms / dirty_ms:>9.1f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+Particle benchmark - NumPy particle columns vs one Python object per particle
+Run from the project root: python -m benchmarks.bench_particles
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import math
+import random
+import time
+import pygame
+from config import Config
+from entities.particles import ParticleSystem
+
+
+class ObjectParticle:
+    """Per-object reference: the design the array system replaces"""
+    
+    def __init__(self, image, x, y, angle, speed, gravity, life):
+        self.image = image
+        self.x, self.y = x, y
+        self.vx, self.vy = math.cos(angle) * speed, math.sin(angle) * speed
+        self.gravity = gravity
+        self.age = 0.0
+        self.life = life
+    
+    def update(self, dt):
+        k = dt / Config.SPEED_REF_MS
+        self.vy += self.gravity * k
+        self.x += self.vx * k
+        self.y += self.vy * k
+        self.age += dt
+        return self.age < self.life
+
+
+def run_objects(screen, image, count, frames):
+    """Keep `count` object particles alive; returns ms per frame (update + draw)"""
+    step = Config.SPEED_REF_MS
+    particles = []
+    start = time.perf_counter()
+    for _ in range(frames):
+        while len(particles) < count:
+            particles.append(ObjectParticle(image, 400, 300, random.uniform(0, math.tau),
+                                            random.uniform(1, 5), 0.2, random.uniform(300, 700)))
+        particles = [p for p in particles if p.update(step)]
+        for p in particles:
+            screen.blit(p.image, (int(p.x), int(p.y)))
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def run_arrays(screen, count, frames):
+    """Keep `count` array particles alive; returns (ms per frame, counters)"""
+    step = Config.SPEED_REF_MS
+    burst = ParticleSystem.EFFECTS["bonus"][1]
+    system = ParticleSystem(capacity=max(count, Config.PARTICLE_CAP), seed=1)
+    start = time.perf_counter()
+    for _ in range(frames):
+        while len(system) + burst <= count:
+            system.emit("bonus", 400, 300)
+        system.update(step)
+        system.draw(screen)
+    elapsed = (time.perf_counter() - start) / frames * 1000
+    counters = system.counters()
+    system.release_assets()
+    return elapsed, counters
+
+
+def main(frames=300):
+    pygame.init()
+    screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+    random.seed(1)
+    probe = ParticleSystem(capacity=1)
+    image = probe.sprites[0]
+    
+    print(f"{'live':>6}{'objects ms':>12}{'arrays ms':>11}{'speedup':>9}{'µs/particle':>13}")
+    for count in (100, Config.PARTICLE_CAP, 2000):
+        object_ms = run_objects(screen, image, count, frames)
+        array_ms, counters = run_arrays(screen, count, frames)
+        per_particle = array_ms * 1000 * frames / max(counters["integrated"], 1)
+        print(f"{count:>6}{object_ms:>12.3f}{array_ms:>11.3f}{object_ms / array_ms:>8.1f}x{per_particle:>13.3f}")
+    
+    # Hard cap: bursts past it are trimmed, never grown into
+    system = ParticleSystem(seed=1)
+    for _ in range(Config.PARTICLE_CAP):
+        system.emit("hurt", 400, 300)
+    print(f"\ncap {system.capacity}: live {len(system)}, dropped {system.dropped}")
+    probe.release_assets()
+    system.release_assets()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
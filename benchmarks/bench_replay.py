@@ -0,0 +1,80 @@
+"""
+Replay benchmark - headless playback speed and determinism check
+Run from the project root: python -m benchmarks.bench_replay [replay.bsr ...]
+Without files, records bot-played sessions first and replays those.
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import sys
+import tempfile
+import time
+import numpy as np
+import pygame
+from config import Config, GameState, TrashType
+from core.game_manager import GameManager
+from core.replay import Replay
+
+
+def bot_input(game):
+    """Chase the lowest item and match its type"""
+    n = game.trash.count
+    if n == 0:
+        return 0, False
+    
+    i = int(np.argmax(game.trash.y[:n]))
+    target = game.trash.x[i] + Config.TRASH_SIZE // 2
+    center = game.player.rect.centerx
+    move = -1 if target < center - 10 else (1 if target > center + 10 else 0)
+    t_type = game.trash.get_type(i)
+    swap = t_type != TrashType.BONUS and t_type != game.player.current_type
+    return move, swap
+
+
+def record(game, level, seed, max_ticks=60 * 60 * 5):
+    """Play a level with the bot; returns the finished replay"""
+    game.begin_level(level, seed)
+    replay = game.replay
+    for _ in range(max_ticks):
+        game.update_gameplay(game.game_clock.step_ms, *bot_input(game))
+        game.game_clock.step()
+        if game.state != GameState.PLAYING:
+            break
+    return replay
+
+
+def main(paths):
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep the player's progress, last replay and run history untouched
+        Config.SAVE_FILE = os.path.join(tmp, "save.json")
+        Config.REPLAY_FILE = os.path.join(tmp, "bench.bsr")
+        Config.HISTORY_FILE = os.path.join(tmp, "history.db")
+        game = GameManager()
+        
+        if paths:
+            replays = [(os.path.basename(p), Replay.load(p)) for p in paths]
+        else:
+            replays = [(f"bot level {level}", record(game, level, seed=level))
+                       for level in (1, 5, 10, game.lvl_mgr.STORM_LEVEL)]
+        
+        print(f"{'replay':<16}{'ticks':>8}{'bytes':>8}{'ms':>10}{'ticks/s':>12}  result")
+        failed = 0
+        for name, replay in replays:
+            t0 = time.perf_counter()
+            result = game.play_replay(replay)
+            elapsed = time.perf_counter() - t0
+            
+            ok = replay.result is None or result == replay.result
+            failed += not ok
+            status = "match" if ok else f"MISMATCH (recorded {replay.result})"
+            print(f"{name:<16}{len(replay):>8}{len(replay.to_bytes()):>8}{elapsed * 1000:>10.1f}"
+                  f"{len(replay) / elapsed:>12.0f}  {result} {status}")
+        game.close()
+    
+    pygame.quit()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+Run history benchmark - batched inserts and leaderboard queries on a large history
+Run from the project root: python -m benchmarks.bench_run_history [--runs 300000]
+"""
+import argparse
+import itertools
+import os
+import random
+import statistics
+import tempfile
+import time
+from core.run_history import RunHistory
+
+LEVELS = 12
+
+
+def fill(history, runs, rng):
+    """Queue `runs` random runs; returns the mean main-thread cost per record in µs"""
+    t0 = time.perf_counter()
+    for _ in range(runs):
+        total = rng.randint(10, 70)
+        caught = rng.randint(0, total)
+        stats = {"caught": caught, "missed": rng.randint(0, total - caught), "total": total}
+        history.record(rng.randint(1, LEVELS), stats, rng.uniform(20000, 90000),
+                       rng.getrandbits(64), rng.random() < 0.4)
+    return (time.perf_counter() - t0) / runs * 1e6
+
+
+def median_ms(func, repeat=50):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BinSort run history benchmark")
+    parser.add_argument("--runs", type=int, default=300000, help="runs to insert")
+    args = parser.parse_args()
+    rng = random.Random(1)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history.db")
+        history = RunHistory(path)
+        t0 = time.perf_counter()
+        record_us = fill(history, args.runs, rng)
+        history.close()
+        elapsed = time.perf_counter() - t0
+        print(f"{args.runs} runs: record() {record_us:.2f} µs each on the caller, "
+              f"all written in {elapsed:.2f} s ({args.runs / elapsed:.0f} runs/s)")
+        
+        history = RunHistory(path)
+        levels = itertools.cycle(range(1, LEVELS + 1))
+        top = median_ms(lambda: history.top_runs(next(levels), 10))
+        summary = median_ms(history.level_summary)
+        scan = median_ms(lambda: history.db.execute(
+            "SELECT level, COUNT(*), SUM(won), SUM(caught), SUM(total), MAX(caught)"
+            " FROM runs GROUP BY level").fetchall(), repeat=5)
+        plan = history.db.execute("EXPLAIN QUERY PLAN " + RunHistory.TOP_RUNS, (1, 10)).fetchall()
+        print(f"top 10 of a level      {top:8.3f} ms   ({plan[0][-1]})")
+        print(f"per-level summary      {summary:8.3f} ms")
+        print(f"summary by full scan   {scan:8.3f} ms   (reference)")
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""
+Texture benchmark - per-pixel Cairo noise vs NumPy array pass
+Run from the project root: python -m benchmarks.bench_texture
+"""
+import random
+import timeit
+import cairo
+from core.asset_factory import AssetFactory
+
+
+def legacy_apply_texture(ctx, width, height, density=0.3):
+    """Original per-pixel implementation, kept here as the reference"""
+    ctx.set_operator(cairo.OPERATOR_ATOP)
+    for _ in range(int(width * height * density)):
+        x = random.randint(0, width)
+        y = random.randint(0, height)
+        alpha = random.uniform(0.1, 0.3)
+        ctx.set_source_rgba(0, 0, 0, alpha)
+        ctx.rectangle(x, y, 1, 1)
+        ctx.fill()
+    ctx.set_operator(cairo.OPERATOR_OVER)
+
+
+def bench(width, height, density, repeat):
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+    ctx = cairo.Context(surface)
+    ctx.set_source_rgb(0.5, 0.5, 0.5)
+    ctx.paint()
+    
+    legacy = timeit.timeit(lambda: legacy_apply_texture(ctx, width, height, density), number=repeat)
+    vector = timeit.timeit(lambda: AssetFactory.apply_texture(surface, density, seed=1), number=repeat)
+    return legacy / repeat * 1000, vector / repeat * 1000
+
+
+def main():
+    cases = [
+        ("trash 24x24", 24, 24, 0.15, 200),
+        ("background 200x150", 200, 150, 0.3, 20),
+        ("full screen 800x600", 800, 600, 0.3, 3),
+    ]
+    print(f"{'case':<22}{'legacy ms':>12}{'numpy ms':>12}{'speedup':>10}")
+    for name, w, h, density, repeat in cases:
+        legacy_ms, vector_ms = bench(w, h, density, repeat)
+        print(f"{name:<22}{legacy_ms:>12.3f}{vector_ms:>12.3f}{legacy_ms / vector_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+Trash storm benchmark - simulation + render cost with thousands of live items
+Run from the project root: python -m benchmarks.bench_trash_storm
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import random
+import tempfile
+import time
+import pygame
+from config import Config, GameState, TrashType
+from core.game_manager import GameManager
+
+
+def fill(game, count):
+    """Restart the storm level with `count` items spread over the screen"""
+    game.save.data["unlocked_level"] = game.lvl_mgr.STORM_LEVEL
+    game.start_level(game.lvl_mgr.STORM_LEVEL)
+    game.state = GameState.PLAYING
+    game.spawner.finished = True
+    for _ in range(count):
+        game.trash.spawn(random.choice(list(TrashType)), Config.BASE_TRASH_SPEED * 0.6)
+    n = game.trash.count
+    game.trash.y[:n] = [random.uniform(-50, Config.SCREEN_HEIGHT) for _ in range(n)]
+
+
+def run(game, frames):
+    step = game.game_clock.step_ms
+    print(f"{'items':>6}{'update ms':>11}{'draw ms':>10}{'fps cap':>10}   voices played/dropped/stolen")
+    for count in (100, 1000, 3000):
+        random.seed(count)
+        fill(game, count)
+        game.sound.voices.reset_counters()
+        update_s = draw_s = 0.0
+        for _ in range(frames):
+            # Keep the population steady: recycle misses to the top
+            game.trash.y[game.trash.offscreen()] = -50
+            
+            t0 = time.perf_counter()
+            game.update_gameplay(step)
+            t1 = time.perf_counter()
+            game.draw_gameplay()
+            pygame.display.flip()
+            t2 = time.perf_counter()
+            update_s += t1 - t0
+            draw_s += t2 - t1
+        
+        update_ms = update_s / frames * 1000
+        draw_ms = draw_s / frames * 1000
+        voices = game.sound.voices
+        print(f"{count:>6}{update_ms:>11.3f}{draw_ms:>10.3f}{1000 / (update_ms + draw_ms):>10.0f}"
+              f"   {voices.played}/{voices.dropped}/{voices.stolen}")
+
+
+def main(frames=120):
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep the player's progress, last replay and run history untouched
+        Config.SAVE_FILE = os.path.join(tmp, "save.json")
+        Config.REPLAY_FILE = os.path.join(tmp, "replay.bsr")
+        Config.HISTORY_FILE = os.path.join(tmp, "history.db")
+        game = GameManager()
+        try:
+            run(game, frames)
+        finally:
+            game.close()
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
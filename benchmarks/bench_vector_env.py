@@ -0,0 +1,26 @@
+"""
+Headless environment throughput - game steps per second per core
+Run from the project root: python -m benchmarks.bench_vector_env
+"""
+import time
+import numpy as np
+from sim.vector_env import BinSortVecEnv
+
+
+def main(steps=2000):
+    rng = np.random.default_rng(0)
+    print(f"{'envs':>6}{'steps/s':>14}{'game steps/s':>16}")
+    for num_envs in (1, 64, 1024):
+        env = BinSortVecEnv(num_envs, level=5)
+        env.reset(seed=0)
+        actions = rng.integers(0, 6, (steps, num_envs))
+        
+        start = time.perf_counter()
+        for i in range(steps):
+            env.step(actions[i])
+        elapsed = time.perf_counter() - start
+        print(f"{num_envs:>6}{steps / elapsed:>14.0f}{steps * num_envs / elapsed:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
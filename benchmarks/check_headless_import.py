@@ -0,0 +1,34 @@
+"""
+Headless import check - the vector environment must run without pygame or Cairo
+Run from the project root: python -m benchmarks.check_headless_import
+Exits non-zero when importing sim (or stepping the env) needs either package.
+"""
+import subprocess
+import sys
+
+# Runs in a fresh interpreter where importing pygame or cairo fails
+PROBE = """
+import sys
+sys.modules["pygame"] = None
+sys.modules["cairo"] = None
+import sim
+env = sim.BinSortVecEnv(4, level=11)
+env.reset(seed=0)
+for _ in range(120):
+    env.step([0, 1, 2, 3])
+print("steps ok, spawned", env.spawned.tolist())
+"""
+
+
+def main():
+    result = subprocess.run([sys.executable, "-c", PROBE], capture_output=True, text=True)
+    print(result.stdout.strip())
+    if result.returncode != 0:
+        print(result.stderr.strip().splitlines()[-1])
+        print("FAIL: sim imports pygame or Cairo")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
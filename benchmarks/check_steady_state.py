@@ -0,0 +1,98 @@
+"""
+Steady-state allocation check - gameplay must not grow the heap frame over frame
+Run from the project root: python -m benchmarks.check_steady_state
+Exits non-zero when net allocations or garbage collections exceed the budget.
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import gc
+import sys
+import tempfile
+import tracemalloc
+import pygame
+from config import Config, GameState
+from core.game_manager import GameManager
+from managers.spawner import Spawner
+
+# Net growth allowed over the second half, and full collections allowed
+MAX_NET_BYTES = 64 * 1024
+MAX_GEN2_COLLECTIONS = 0
+
+# Schedule length standing in for an endless level
+ENDLESS_ITEMS = 50000
+
+
+def start_endless_level(game, level=1):
+    """Play `level` with no damage and more trash than a measurement uses"""
+    game.save.data["unlocked_level"] = max(game.save.get_unlocked_level(), level)
+    game.start_level(level)
+    game.state = GameState.PLAYING
+    game.level_data = dict(game.level_data, damage=False, total_trash=ENDLESS_ITEMS)
+    game.spawner = Spawner(game.level_data, game.spawner.rng)
+
+
+def play(game, frames):
+    step = game.game_clock.step_ms
+    for _ in range(frames):
+        game.update_gameplay(step)
+        game.game_clock.step()
+        game.present(game.draw_gameplay_dirty())
+
+
+def measure(game, level, warmup, frames):
+    """Heap growth and collections over two halves of `frames` after a warmup
+    
+    The live population drifts a little, so a leak shows as growth in both
+    halves; only the second half is held to the budget.
+    """
+    start_endless_level(game, level)
+    
+    # Warm caches (glyphs, sprites, store capacity) before measuring
+    play(game, warmup)
+    gc.collect()
+    
+    tracemalloc.start(10)
+    collections_before = [g["collections"] for g in gc.get_stats()]
+    snapshots = [tracemalloc.take_snapshot()]
+    for _ in range(2):
+        play(game, frames // 2)
+        snapshots.append(tracemalloc.take_snapshot())
+    collections = [g["collections"] - c for g, c in zip(gc.get_stats(), collections_before)]
+    tracemalloc.stop()
+    
+    first = sum(s.size_diff for s in snapshots[1].compare_to(snapshots[0], "lineno"))
+    stats = snapshots[2].compare_to(snapshots[1], "traceback")
+    net = sum(s.size_diff for s in stats)
+    print(f"level {level}: {frames} frames, {game.trash.count} live items, "
+          f"net {first / 1024:+.1f} / {net / 1024:+.1f} KiB, collections per generation {collections}")
+    for s in stats[:3]:
+        if s.size_diff > 0:
+            print(f"  {s.size_diff / 1024:+.1f} KiB  {s.traceback.format()[-1].strip()}")
+    return net <= MAX_NET_BYTES and collections[2] <= MAX_GEN2_COLLECTIONS
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep the player's progress, last replay and run history untouched
+        Config.SAVE_FILE = os.path.join(tmp, "save.json")
+        Config.REPLAY_FILE = os.path.join(tmp, "replay.bsr")
+        Config.HISTORY_FILE = os.path.join(tmp, "history.db")
+        game = GameManager()
+        try:
+            ok = measure(game, 1, warmup=600, frames=3000)
+            ok &= measure(game, game.lvl_mgr.STORM_LEVEL, warmup=600, frames=400)
+        finally:
+            game.close()
+    pygame.quit()
+    
+    if not ok:
+        print("FAIL: gameplay allocations are not flat")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""
+Warm start check - a filled bake cache must install every asset without synthesis
+Run from the project root: python -m benchmarks.check_warm_start
+Exits non-zero when baked PCM is thrown away and resynthesized on the main thread,
+or when a warm start still has assets to generate.
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import sys
+import tempfile
+import pygame
+from config import Config
+from audio.sound_manager import AudioFactory
+from core.asset_factory import asset_registry
+from core.bake_cache import default_bake_cache
+from core.game_manager import GameManager
+
+
+def start_once():
+    """Start a game, load every asset and shut it down; returns its bake pipeline"""
+    asset_registry.clear()
+    AudioFactory._pcm_cache.clear()
+    game = GameManager()
+    game.load_assets()
+    mixer = pygame.mixer.get_init()
+    game.close()
+    pygame.quit()
+    return game.bake, mixer
+
+
+def main():
+    directory = default_bake_cache.directory
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        # Fresh bake cache; keep the player's progress and run history untouched
+        default_bake_cache.directory = os.path.join(tmp, "bake")
+        Config.SAVE_FILE = os.path.join(tmp, "save.json")
+        Config.REPLAY_FILE = os.path.join(tmp, "replay.bsr")
+        Config.HISTORY_FILE = os.path.join(tmp, "history.db")
+        try:
+            for name in ("cold", "warm"):
+                bake, mixer = start_once()
+                jobs = len(bake.jobs)
+                print(f"{name}: mixer {mixer}, {bake.cached}/{jobs} jobs from cache, "
+                      f"{bake.resynthesized} PCM resynthesized")
+                if bake.resynthesized:
+                    print(f"FAIL: {name} start resynthesized baked PCM on the main thread")
+                    failed = True
+                if name == "warm" and bake.cached != jobs:
+                    print("FAIL: warm start generated assets instead of loading them")
+                    failed = True
+        finally:
+            default_bake_cache.directory = directory
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""
+Level report - difficulty of every level from its compiled spawn schedule
+Run from the project root: python -m benchmarks.report_levels [--seeds N]
+Nothing is played or drawn; figures are averaged over seeds 0..N-1.
+"""
+import argparse
+import random
+import statistics
+import time
+from managers.level_manager import LevelManager
+from managers.spawner import Spawner
+
+COLUMNS = ("items", "bonus", "duration_s", "items_per_s", "peak_on_screen", "mean_speed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BinSort level difficulty report")
+    parser.add_argument("--seeds", type=int, default=20, help="schedules per level")
+    args = parser.parse_args()
+    
+    lvl_mgr = LevelManager()
+    print(f"{'level':<7}" + "".join(f"{name:>16}" for name in COLUMNS) + f"{'compile ms':>12}")
+    for level in sorted(lvl_mgr.levels):
+        data = lvl_mgr.get_level_data(level)
+        rows = []
+        t0 = time.perf_counter()
+        for seed in range(args.seeds):
+            rows.append(Spawner(data, random.Random(seed)).summary())
+        compile_ms = (time.perf_counter() - t0) * 1000 / args.seeds
+        
+        means = [statistics.mean(row[name] for row in rows) for name in COLUMNS]
+        print(f"{level:<7}" + "".join(f"{value:>16.2f}" for value in means) + f"{compile_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
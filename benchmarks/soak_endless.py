@@ -0,0 +1,99 @@
+"""
+Endless soak test - resident memory must stay flat over a long endless session
+Run from the project root: python -m benchmarks.soak_endless [--minutes 120]
+Simulates (and draws) as fast as possible; exits non-zero if RSS keeps growing.
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import resource
+import sys
+import tempfile
+import time
+import pygame
+from config import Config, GameState
+from core.game_manager import GameManager
+from benchmarks.bench_replay import bot_input
+
+# Growth allowed between the end of the warmup and the end of the run
+MAX_RSS_GROWTH = 8 * 1024 * 1024
+WARMUP_MINUTES = 5
+
+
+def rss_bytes():
+    """Current resident set size (peak size where /proc is unavailable)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def soak(game, minutes, draw_every):
+    """Play endless mode with the bot; returns RSS samples, one per sim minute"""
+    game.save.data["unlocked_level"] = game.lvl_mgr.ENDLESS_LEVEL
+    game.start_level(game.lvl_mgr.ENDLESS_LEVEL)
+    # The bot misses now and then; keep the session alive for the whole run
+    game.level_data = dict(game.level_data, damage=False)
+    
+    step = game.game_clock.step_ms
+    ticks_per_minute = Config.SIM_HZ * 60
+    samples = []
+    for minute in range(minutes):
+        for tick in range(ticks_per_minute):
+            game.update_gameplay(step, *bot_input(game))
+            game.game_clock.step()
+            if tick % draw_every == 0:
+                game.present(game.draw_gameplay_dirty())
+        if game.state != GameState.PLAYING:
+            break
+        
+        samples.append(rss_bytes())
+        if minute % 10 == 9:
+            print(f"  {minute + 1:>4} min  segment {game.spawner.segment:>5}  "
+                  f"rss {samples[-1] / 2**20:7.1f} MiB  score {game.stats['caught']}/{game.stats['total']}  "
+                  f"store {game.trash.capacity}  text cache {len(game.ui.text_cache)}  "
+                  f"replay {len(game.replay)}")
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BinSort endless-mode memory soak")
+    parser.add_argument("--minutes", type=int, default=120, help="simulated minutes")
+    parser.add_argument("--draw-every", type=int, default=1, help="draw one frame per N sim steps")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep the player's progress, last replay and run history untouched
+        Config.SAVE_FILE = os.path.join(tmp, "save.json")
+        Config.REPLAY_FILE = os.path.join(tmp, "replay.bsr")
+        Config.HISTORY_FILE = os.path.join(tmp, "history.db")
+        game = GameManager()
+        try:
+            t0 = time.perf_counter()
+            samples = soak(game, args.minutes, args.draw_every)
+            elapsed = time.perf_counter() - t0
+        finally:
+            game.close()
+    pygame.quit()
+    
+    if len(samples) <= WARMUP_MINUTES:
+        print("FAIL: session ended before the warmup was over")
+        return 1
+    
+    settled = samples[WARMUP_MINUTES - 1]
+    growth = samples[-1] - settled
+    print(f"{len(samples)} sim minutes in {elapsed:.0f} s, rss {settled / 2**20:.1f} -> "
+          f"{samples[-1] / 2**20:.1f} MiB ({growth / 2**20:+.1f} MiB after warmup)")
+    if growth > MAX_RSS_GROWTH:
+        print("FAIL: resident memory grows during endless play")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,239 @@
+"""
+Benchmark suite - startup, asset generation, audio synthesis and frame cost
+Run from the project root: python -m benchmarks.suite [--update-baseline]
+
+Results (median milliseconds) are written as JSON and compared against
+benchmarks/baseline.json when it exists. Baselines are machine specific:
+record one with --update-baseline on the machine that will run the suite.
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import numpy as np
+import pygame
+from config import Config, TrashType
+from audio.sound_manager import AudioFactory, SoundManager
+from core.asset_factory import AssetFactory, asset_registry
+from core.bake_cache import default_bake_cache
+from core.game_manager import GameManager
+from managers.ui_manager import UIElement
+from benchmarks.bench_trash_storm import fill
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def median_ms(func, repeat, setup=None):
+    """Median wall time of `repeat` calls, with optional untimed setup before each"""
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+
+def forget_assets():
+    """Drop in-memory caches so the next GameManager generates or loads everything"""
+    asset_registry.clear()
+    AudioFactory._pcm_cache.clear()
+
+
+def bench_startup(results, repeat):
+    """GameManager.__init__ (title screen ready) and full asset load, with an
+    empty bake cache (cold) and a filled one (warm)"""
+    directory = default_bake_cache.directory
+    with tempfile.TemporaryDirectory() as tmp:
+        default_bake_cache.directory = tmp
+        try:
+            for name in ("cold", "warm"):
+                title_s = []
+                all_s = []
+                for _ in range(repeat):
+                    forget_assets()
+                    if name == "cold":
+                        default_bake_cache.clear()
+                    
+                    t0 = time.perf_counter()
+                    game = GameManager()
+                    t1 = time.perf_counter()
+                    game.load_assets()
+                    t2 = time.perf_counter()
+                    # Stop its threads and bake pool before the next measurement
+                    game.close()
+                    title_s.append(t1 - t0)
+                    all_s.append(t2 - t0)
+                
+                results[f"startup.{name}"] = statistics.median(title_s) * 1000
+                results[f"startup.{name}.all_assets"] = statistics.median(all_s) * 1000
+        finally:
+            default_bake_cache.directory = directory
+
+
+def bench_assets(results, repeat):
+    """One uncached call of every AssetFactory generator"""
+    w, h = Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT
+    cases = {
+        "menu_background": (AssetFactory.create_menu_background, (w, h), 3),
+        "game_background": (AssetFactory.create_game_background, (w, h), 3),
+        "heart_sprite": (AssetFactory.create_heart_sprite, (), repeat),
+        "cursor": (AssetFactory.create_cursor, (), repeat),
+        "bin_sprite": (AssetFactory.create_bin_sprite, (Config.GREEN,), repeat),
+        "button_sprite": (AssetFactory.create_button_sprite, (200, 50, Config.BLUE), repeat),
+        "particle_sprite": (AssetFactory.create_particle_sprite, (Config.GOLD, 3), repeat),
+    }
+    for t_type in TrashType:
+        cases[f"trash_sprite.{t_type.name.lower()}"] = (AssetFactory.create_trash_sprite, (t_type,), repeat)
+    
+    # Every generator needs a case, or new ones would silently go unmeasured
+    covered = {generator.__name__ for generator, _, _ in cases.values()}
+    missing = sorted(name for name in vars(AssetFactory) if name.startswith("create_") and name not in covered)
+    if missing:
+        raise RuntimeError(f"bench_assets has no case for {', '.join(missing)}")
+    
+    for name, (generator, args, count) in cases.items():
+        results[f"asset.{name}"] = median_ms(lambda: generator(*args), count)
+
+
+def bench_audio(results, repeat):
+    """Uncached synthesis of each sound effect"""
+    for name, params in SoundManager.SFX.items():
+        results[f"audio.{name}"] = median_ms(lambda: AudioFactory.generate_sound(*params), repeat,
+                                             AudioFactory._pcm_cache.clear)
+
+
+def bench_ui(results, repeat):
+    """Button construction, uncached and through the shared registry"""
+    def build():
+        UIElement(0, 0, 200, 50, "PLAY", "noop", Config.GREEN)
+    
+    results["ui.button.cold"] = median_ms(build, repeat, asset_registry.clear)
+    build()
+    results["ui.button.warm"] = median_ms(build, repeat)
+
+
+def bench_frames(results, game, frames):
+    """Gameplay update and full redraw with a steady number of live items"""
+    step = game.game_clock.step_ms
+    for count in (10, 100, 1000):
+        random.seed(count)
+        fill(game, count)
+        update_s = []
+        draw_s = []
+        for _ in range(frames):
+            game.trash.y[game.trash.offscreen()] = -50
+            
+            t0 = time.perf_counter()
+            game.update_gameplay(step)
+            t1 = time.perf_counter()
+            game.draw_gameplay()
+            t2 = time.perf_counter()
+            update_s.append(t1 - t0)
+            draw_s.append(t2 - t1)
+        
+        results[f"frame.update.{count}"] = statistics.median(update_s) * 1000
+        results[f"frame.draw.{count}"] = statistics.median(draw_s) * 1000
+
+
+def run(repeat, frames):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep the player's progress, last replay and run history untouched
+        Config.SAVE_FILE = os.path.join(tmp, "save.json")
+        Config.REPLAY_FILE = os.path.join(tmp, "replay.bsr")
+        Config.HISTORY_FILE = os.path.join(tmp, "history.db")
+        bench_startup(results, max(1, repeat // 10))
+        bench_assets(results, repeat)
+        bench_audio(results, repeat)
+        bench_ui(results, repeat)
+        game = GameManager()
+        try:
+            bench_frames(results, game, frames)
+        finally:
+            game.close()
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "results": {name: round(ms, 4) for name, ms in results.items()},
+    }
+
+
+def compare(current, baseline, tolerance, min_delta):
+    """Print a per-benchmark comparison; returns names that got slower than allowed
+    
+    A regression must exceed both the relative tolerance and min_delta ms, so
+    timer noise on sub-millisecond benchmarks does not fail the run.
+    """
+    regressions = []
+    print(f"{'benchmark':<32}{'baseline ms':>13}{'current ms':>12}{'change':>9}", file=sys.stderr)
+    for name, ms in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<32}{'-':>13}{ms:>12.3f}{'new':>9}", file=sys.stderr)
+            continue
+        change = ms / base - 1 if base else 0.0
+        flag = ""
+        if change > tolerance and ms - base > min_delta:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<32}{base:>13.3f}{ms:>12.3f}{change:>+9.0%}{flag}", file=sys.stderr)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BinSort benchmark suite")
+    parser.add_argument("--output", help="write results JSON here instead of stdout")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    parser.add_argument("--min-delta", type=float, default=0.05, help="smallest slowdown in ms that counts")
+    parser.add_argument("--repeat", type=int, default=30, help="calls per micro-benchmark")
+    parser.add_argument("--frames", type=int, default=120, help="frames per item count")
+    args = parser.parse_args()
+    
+    current = run(args.repeat, args.frames)
+    pygame.quit()
+    
+    text = json.dumps(current, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+    
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            f.write(text)
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+    
+    if not os.path.exists(args.baseline):
+        print("No baseline yet; run with --update-baseline to record one", file=sys.stderr)
+        return 0
+    
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(current, baseline, args.tolerance, args.min_delta)
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed beyond {args.tolerance:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -6,7 +6,33 @@ class Config:
     FPS = 60
     TITLE = "BinSort"
     
+    # Window: None opens it at the logical size; otherwise frames are scaled
+    # into it ("integer" keeps whole-pixel factors, "fit" fills it)
+    WINDOW_SIZE = None
+    FULLSCREEN = False
+    SCALE_MODE = "integer"
+    
+    # Gameplay world drawn on a canvas this many times smaller, upscaled once
+    # per frame (4 -> 200x150); 1 draws it at full resolution
+    CANVAS_SCALE = 1
+    
+    # Fixed-step simulation; speeds are tuned in pixels per 1/60 s
+    SIM_HZ = 60
+    SPEED_REF_MS = 1000 / 60
+    MAX_SIM_STEPS = 5
+    TIME_SCALE = 1.0
+    
+    # Dirty-rect gameplay rendering; full flip above this fraction of the screen
+    DIRTY_RECTS = True
+    DIRTY_RECT_MAX_AREA = 0.35
+    
+    # Frame profiler: F3 toggles recording and overlay, F4 dumps a Chrome trace
+    PROFILER_ENABLED = False
+    PROFILER_FRAMES = 600
+    TRACE_FILE = "data/frame_trace.json"
+    
     FONT_FILE = "PressStart2P.ttf"
+    TEXT_CACHE_SIZE = 128
     
     # Color palette
     WHITE = (255, 255, 255)
@@ -21,7 +47,37 @@ class Config:
     SWAP_COOLDOWN = 250
     BASE_TRASH_SPEED = 6
     
+    # Gameplay geometry (sprite sizes after upscaling)
+    BIN_SIZE = 96
+    TRASH_SIZE = 48
+    BIN_FLOOR_GAP = 20
+    LID_DEPTH = 15
+    
+    # Effect particles: hard cap on live particles (arrays are preallocated to it)
+    PARTICLES_ENABLED = True
+    PARTICLE_CAP = 512
+    
+    # Procedural music, streamed in one-step chunks (queue bounds memory and tempo latency)
+    MUSIC_ENABLED = True
+    MUSIC_VOLUME = 0.35
+    MUSIC_QUEUE_CHUNKS = 4
+    
     SAVE_FILE = "data/binsort_save.json"
+    # Saves are written off the main thread; changes this close together share one write
+    SAVE_COALESCE_MS = 250
+    # Every finished or failed run (SQLite), inserted in batches off the main thread
+    HISTORY_FILE = "data/run_history.db"
+    HISTORY_BATCH_MS = 250
+    # Last finished session, replayable headless (benchmarks/bench_replay.py)
+    REPLAY_FILE = "data/last_replay.bsr"
+    # Input kept per session (one byte per sim step); longer endless runs keep the first hour
+    REPLAY_MAX_TICKS = 60 * 60 * 60
+    
+    # Baked procedural assets (raw pixels / PCM)
+    BAKE_DIR = "data/bake"
+    BAKE_ENABLED = True
+    # Bake worker processes (None: one per CPU, 0: generate on the main process)
+    BAKE_WORKERS = None
 
 
 class GameState(Enum):
@@ -1,5 +1,30 @@
-from .game_manager import GameManager
-from .asset_factory import AssetFactory
-from .save_manager import SaveManager
+import importlib
 
-__all__ = ['GameManager', 'AssetFactory', 'SaveManager']
\ No newline at end of file
+# Public name -> submodule defining it. Submodules load on first access, so
+# headless tools (sim) can use Cairo-free modules such as game_clock and
+# replay without pygame or Cairo installed, and GameManager (which imports
+# entities and managers) does not form an import cycle
+_EXPORTS = {
+    'GameManager': 'game_manager',
+    'AssetFactory': 'asset_factory',
+    'AssetRegistry': 'asset_factory',
+    'asset_registry': 'asset_factory',
+    'BakeCache': 'bake_cache',
+    'default_bake_cache': 'bake_cache',
+    'BakePipeline': 'bake_pipeline',
+    'Display': 'display',
+    'GameClock': 'game_clock',
+    'FrameProfiler': 'profiler',
+    'Replay': 'replay',
+    'RunHistory': 'run_history',
+    'SaveManager': 'save_manager',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
\ No newline at end of file
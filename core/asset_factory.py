@@ -5,16 +5,24 @@ Generates all visual assets procedurally
 import pygame
 import cairo
 import math
-import random
+import numpy as np
+from collections import OrderedDict
 from config import Config, TrashType
+from core.bake_cache import default_bake_cache
 
 
 class AssetFactory:
     """Procedural asset generation using Cairo"""
     
+    # Native upscale of the pixel art drawn in the gameplay world
+    BG_SCALE = 4
+    BIN_SCALE = 3
+    TRASH_SCALE = 2
+    PARTICLE_SCALE = 2
+    
     @staticmethod
-    def cairo_to_pygame(surface: cairo.ImageSurface, scale: int = 1) -> pygame.Surface:
-        """Convert Cairo surface to Pygame surface"""
+    def cairo_to_pygame(surface: cairo.ImageSurface, scale: float = 1) -> pygame.Surface:
+        """Convert Cairo surface to Pygame surface; fractional scales shrink it"""
         width = surface.get_width()
         height = surface.get_height()
         data = surface.get_data()
@@ -24,27 +32,92 @@ class AssetFactory:
         except ValueError:
             pyg_surf = pygame.image.frombuffer(data, (width, height), "RGBA")
         
-        if scale > 1:
-            pyg_surf = pygame.transform.scale(pyg_surf, (width * scale, height * scale))
+        if scale != 1:
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            pyg_surf = pygame.transform.scale(pyg_surf, size)
         
         return pyg_surf
     
     @staticmethod
-    def apply_texture(ctx, width, height, density=0.3):
-        """Apply noise texture overlay"""
-        ctx.set_operator(cairo.OPERATOR_ATOP)
-        for _ in range(int(width * height * density)):
-            x = random.randint(0, width)
-            y = random.randint(0, height)
-            alpha = random.uniform(0.1, 0.3)
-            ctx.set_source_rgba(0, 0, 0, alpha)
-            ctx.rectangle(x, y, 1, 1)
-            ctx.fill()
-        ctx.set_operator(cairo.OPERATOR_OVER)
+    def finalize(surface, opaque=False):
+        """Convert a generated surface to the display pixel format
+        
+        Done once, so blits skip per-pixel format conversion and the surface no
+        longer references the Cairo or bake-cache buffer. Sprites keep per-pixel
+        alpha and are RLE encoded, so blits skip their transparent runs; opaque
+        backgrounds drop alpha. Surfaces pass through unchanged until a display
+        mode is set.
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        if opaque:
+            return surface.convert()
+        surface = surface.convert_alpha()
+        surface.set_alpha(255, pygame.RLEACCEL)
+        return surface
+    
+    @staticmethod
+    def world_scale(native):
+        """Sprite scale for the low-res world canvas, or None at full resolution"""
+        if Config.CANVAS_SCALE <= 1:
+            return None
+        return native / Config.CANVAS_SCALE
+    
+    @staticmethod
+    def pixel_view(surface: cairo.ImageSurface) -> np.ndarray:
+        """Writable (h, w, 4) view of a Cairo surface buffer (premultiplied BGRA)"""
+        width = surface.get_width()
+        height = surface.get_height()
+        stride = surface.get_stride()
+        rows = np.ndarray((height, stride), dtype=np.uint8, buffer=surface.get_data())
+        return rows[:, :width * 4].reshape(height, width, 4)
     
     @staticmethod
-    def create_menu_background(screen_width, screen_height):
+    def apply_texture(surface: cairo.ImageSurface, density=0.3, seed=None):
+        """Apply noise texture overlay in a single array pass"""
+        rng = np.random.default_rng(seed)
+        surface.flush()
+        pixels = AssetFactory.pixel_view(surface)
+        h, w = pixels.shape[:2]
+        
+        # Random 1px black specks at 10-30% opacity; overlapping specks stack
+        count = int(w * h * density)
+        xs = rng.integers(0, w, count)
+        ys = rng.integers(0, h, count)
+        shade = np.ones((h, w), dtype=np.float32)
+        np.multiply.at(shade, (ys, xs), rng.uniform(0.7, 0.9, count).astype(np.float32))
+        
+        # Black ATOP only darkens colour channels, alpha is untouched
+        color = pixels[..., :3]
+        color[...] = (color * shade[..., None] + 0.5).astype(np.uint8)
+        surface.mark_dirty()
+    
+    @staticmethod
+    def scatter_rects(surface: cairo.ImageSurface, xs, ys, rect_w, rect_h, rgba):
+        """Blend many same-colour rectangles at once, stacking like repeated fills"""
+        surface.flush()
+        pixels = AssetFactory.pixel_view(surface)
+        h, w = pixels.shape[:2]
+        
+        # Coverage count per pixel via a 2D difference array
+        diff = np.zeros((h + rect_h + 1, w + rect_w + 1), dtype=np.int32)
+        np.add.at(diff, (ys, xs), 1)
+        np.add.at(diff, (ys, xs + rect_w), -1)
+        np.add.at(diff, (ys + rect_h, xs), -1)
+        np.add.at(diff, (ys + rect_h, xs + rect_w), 1)
+        coverage = diff.cumsum(axis=0).cumsum(axis=1)[:h, :w]
+        
+        # n OVER passes of the same colour: target + (dst - target) * (1 - a)^n
+        r, g, b, a = rgba
+        target = np.array([b, g, r, 1.0], dtype=np.float32) * 255
+        keep = ((1 - a) ** coverage).astype(np.float32)[..., None]
+        pixels[...] = (target + (pixels - target) * keep + 0.5).astype(np.uint8)
+        surface.mark_dirty()
+    
+    @staticmethod
+    def create_menu_background(screen_width, screen_height, seed=None):
         """Create forest scene background for menu"""
+        rng = np.random.default_rng(seed)
         scale = 4
         w = screen_width // scale
         h = screen_height // scale
@@ -83,8 +156,9 @@ class AssetFactory:
         ctx.set_source_rgb(0.1, 0.25, 0.3)
         ctx.move_to(0, h)
         ctx.line_to(0, h*0.65)
-        for i in range(0, w, 5):
-            peak = random.randint(0, 8)
+        xs = range(0, w, 5)
+        peaks = rng.integers(0, 9, len(xs))
+        for i, peak in zip(xs, peaks.tolist()):
             ctx.line_to(i, h*0.65 - peak)
             ctx.line_to(i+2, h*0.65)
         ctx.line_to(w, h*0.65)
@@ -98,12 +172,9 @@ class AssetFactory:
         ctx.fill()
         
         # Grass highlights
-        ctx.set_source_rgba(0.7, 0.9, 0.4, 0.5)
-        for _ in range(50):
-            rx = random.randint(0, w)
-            ry = random.randint(int(h*0.7), h)
-            ctx.rectangle(rx, ry, 4, 2)
-            ctx.fill()
+        rx = rng.integers(0, w + 1, 50)
+        ry = rng.integers(int(h*0.7), h + 1, 50)
+        AssetFactory.scatter_rects(surface, rx, ry, 4, 2, (0.7, 0.9, 0.4, 0.5))
         
         # Foreground trees
         ctx.set_source_rgb(0.5, 0.3, 0.2)
@@ -128,10 +199,12 @@ class AssetFactory:
         
         # Bushes
         ctx.set_source_rgb(0.1, 0.3, 0.15)
-        for i in range(-20, w+20, 15):
-            radius = random.randint(10, 20)
+        xs = range(-20, w+20, 15)
+        radii = rng.integers(10, 21, len(xs))
+        for i, radius in zip(xs, radii.tolist()):
+            ctx.new_sub_path()
             ctx.arc(i, h, radius, 0, 2*math.pi)
-            ctx.fill()
+        ctx.fill()
         
         # Dark overlay
         ctx.set_source_rgba(0, 0, 0, 0.4)
@@ -141,11 +214,10 @@ class AssetFactory:
         return AssetFactory.cairo_to_pygame(surface, scale=scale)
     
     @staticmethod
-    def create_game_background(screen_width, screen_height):
+    def create_game_background(screen_width, screen_height, scale=BG_SCALE):
         """Create gameplay background"""
-        scale = 4
-        w = screen_width // scale
-        h = screen_height // scale
+        w = screen_width // AssetFactory.BG_SCALE
+        h = screen_height // AssetFactory.BG_SCALE
         surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, w, h)
         ctx = cairo.Context(surface)
         
@@ -196,7 +268,24 @@ class AssetFactory:
         return AssetFactory.cairo_to_pygame(surface, scale=scale)
     
     @staticmethod
-    def create_heart_sprite():
+    def create_particle_sprite(color_rgb, size, scale=PARTICLE_SCALE):
+        """Create a square effect particle with a light core"""
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, size, size)
+        ctx = cairo.Context(surface)
+        r, g, b = [c/255.0 for c in color_rgb]
+        
+        ctx.set_source_rgb(r, g, b)
+        ctx.rectangle(0, 0, size, size)
+        ctx.fill()
+        if size > 2:
+            ctx.set_source_rgb(min(1, r + 0.4), min(1, g + 0.4), min(1, b + 0.4))
+            ctx.rectangle(1, 1, size - 2, size - 2)
+            ctx.fill()
+        
+        return AssetFactory.cairo_to_pygame(surface, scale=scale)
+    
+    @staticmethod
+    def create_heart_sprite(scale=2):
         """Create heart icon for HUD"""
         w, h = 16, 16
         surf = cairo.ImageSurface(cairo.FORMAT_ARGB32, w, h)
@@ -213,10 +302,10 @@ class AssetFactory:
         ctx.set_line_width(1)
         ctx.stroke()
         
-        return AssetFactory.cairo_to_pygame(surf, scale=2)
+        return AssetFactory.cairo_to_pygame(surf, scale=scale)
     
     @staticmethod
-    def create_cursor():
+    def create_cursor(scale=2):
         """Create custom cursor sprite"""
         w, h = 16, 16
         surf = cairo.ImageSurface(cairo.FORMAT_ARGB32, w, h)
@@ -236,10 +325,10 @@ class AssetFactory:
         ctx.set_line_width(1)
         ctx.stroke()
         
-        return AssetFactory.cairo_to_pygame(surf, scale=2)
+        return AssetFactory.cairo_to_pygame(surf, scale=scale)
     
     @staticmethod
-    def create_bin_sprite(color_rgb):
+    def create_bin_sprite(color_rgb, scale=BIN_SCALE):
         """Create trash bin sprite with outline"""
         surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 32, 32)
         ctx = cairo.Context(surface)
@@ -271,10 +360,10 @@ class AssetFactory:
         ctx.rectangle(20, 15, 2, 10)
         ctx.fill()
         
-        return AssetFactory.cairo_to_pygame(surface, scale=3)
+        return AssetFactory.cairo_to_pygame(surface, scale=scale)
     
     @staticmethod
-    def create_trash_sprite(t_type: TrashType, variant_idx=0):
+    def create_trash_sprite(t_type: TrashType, variant_idx=0, scale=TRASH_SCALE, seed=None):
         """Create trash item sprites with outlines"""
         w, h = 24, 24
         surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, w, h)
@@ -410,5 +499,146 @@ class AssetFactory:
             ctx.fill_preserve()
             stroke()
         
-        AssetFactory.apply_texture(ctx, w, h, 0.15)
-        return AssetFactory.cairo_to_pygame(surface, scale=2)
\ No newline at end of file
+        AssetFactory.apply_texture(surface, 0.15, seed)
+        return AssetFactory.cairo_to_pygame(surface, scale=scale)
+    
+    @staticmethod
+    def create_button_sprite(width, height, color_rgb, hover=False):
+        """Create 3D button surface with drop shadow"""
+        depth = 6
+        s = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height + depth)
+        ctx = cairo.Context(s)
+        
+        w, h = width, height
+        r, g, b = [c/255.0 for c in color_rgb]
+        
+        # Adjust brightness for hover/shadow
+        shadow_r, shadow_g, shadow_b = r * 0.6, g * 0.6, b * 0.6
+        if hover:
+            r, g, b = min(1, r*1.2), min(1, g*1.2), min(1, b*1.2)
+        
+        # Black outline
+        ctx.set_source_rgba(0, 0, 0, 1)
+        AssetFactory._rounded_rect(ctx, 0, depth, w, h, 8)
+        AssetFactory._rounded_rect(ctx, 0, 0, w, h, 8)
+        ctx.fill()
+        
+        # Shadow (darker bottom)
+        ctx.set_source_rgba(shadow_r, shadow_g, shadow_b, 1)
+        AssetFactory._rounded_rect(ctx, 2, 2 + depth - 2, w-4, h-4, 6)
+        ctx.fill()
+        
+        # Main face
+        ctx.set_source_rgba(r, g, b, 1)
+        AssetFactory._rounded_rect(ctx, 2, 2, w-4, h-6, 6)
+        ctx.fill()
+        
+        return AssetFactory.cairo_to_pygame(s, 1)
+    
+    @staticmethod
+    def _rounded_rect(ctx, x, y, w, h, r):
+        """Draw rounded rectangle path"""
+        ctx.move_to(x+r, y)
+        ctx.line_to(x+w-r, y)
+        ctx.curve_to(x+w, y, x+w, y, x+w, y+r)
+        ctx.line_to(x+w, y+h-r)
+        ctx.curve_to(x+w, y+h, x+w, y+h, x+w-r, y+h)
+        ctx.line_to(x+r, y+h)
+        ctx.curve_to(x, y+h, x, y+h, x, y+h-r)
+        ctx.line_to(x, y+r)
+        ctx.curve_to(x, y, x, y, x+r, y)
+        ctx.close_path()
+
+
+class AssetRegistry:
+    """Refcounted cache of generated surfaces shared between entities and UI"""
+    
+    def __init__(self, max_idle=64, bake=None):
+        # Optional on-disk cache consulted on misses
+        self.bake = bake
+        
+        # key -> [surface, refcount]; key is (generator, params, scale)
+        self.entries = {}
+        # Keys with refcount 0, least recently used first
+        self.idle = OrderedDict()
+        self.max_idle = max_idle
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def acquire(self, generator, *params, scale=None):
+        """Get a shared surface, generating it only on first use"""
+        key = (generator, params, scale)
+        entry = self.entries.get(key)
+        
+        if entry is None:
+            self.misses += 1
+            entry = [self._generate(generator, params, scale), 0]
+            self.entries[key] = entry
+        else:
+            self.hits += 1
+            if entry[1] == 0:
+                del self.idle[key]
+        
+        entry[1] += 1
+        return entry[0]
+    
+    def _generate(self, generator, params, scale):
+        kwargs = {} if scale is None else {"scale": scale}
+        if self.bake is not None:
+            return AssetFactory.finalize(self.bake.surface(generator, *params, **kwargs))
+        return AssetFactory.finalize(generator(*params, **kwargs))
+    
+    def preload(self, surface, generator, *params, scale=None):
+        """Insert a surface generated elsewhere (e.g. by a bake worker) as idle"""
+        key = (generator, params, scale)
+        if key in self.entries:
+            return
+        
+        self.entries[key] = [AssetFactory.finalize(surface), 0]
+        self.idle[key] = None
+        self._evict()
+    
+    def finalize_all(self):
+        """Convert surfaces cached before the display mode was set"""
+        for entry in self.entries.values():
+            entry[0] = AssetFactory.finalize(entry[0])
+    
+    def release(self, generator, *params, scale=None):
+        """Drop one reference; unused surfaces become eligible for eviction"""
+        key = (generator, params, scale)
+        entry = self.entries.get(key)
+        if entry is None or entry[1] == 0:
+            return
+        
+        entry[1] -= 1
+        if entry[1] == 0:
+            self.idle[key] = None
+            self._evict()
+    
+    def _evict(self):
+        # Evict least recently released surfaces beyond the idle budget
+        while len(self.idle) > self.max_idle:
+            old_key, _ = self.idle.popitem(last=False)
+            del self.entries[old_key]
+            self.evictions += 1
+    
+    def clear(self):
+        """Forget every cached surface"""
+        self.entries.clear()
+        self.idle.clear()
+    
+    def get_stats(self):
+        """Get cache counters for debugging and benchmarks"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "idle": len(self.idle)
+        }
+
+
+# Shared instance used by entities and UI
+asset_registry = AssetRegistry(bake=default_bake_cache)
\ No newline at end of file
@@ -0,0 +1,187 @@
+"""
+Bake Cache - persistent store for procedural assets
+Raw pixel buffers and PCM are memory-mapped back on warm starts
+"""
+import pygame
+import hashlib
+import inspect
+import mmap
+import os
+import shutil
+import struct
+from config import Config
+
+
+class BakeCache:
+    """On-disk cache of generated surfaces and sounds
+    
+    Files live in one subdirectory per generator module and source version
+    ("<module>.<source hash>"). The first key made for a module deletes the
+    subdirectories of its older versions, so edits never leave stale files.
+    """
+    
+    # magic, width (or byte length), height (or 0)
+    HEADER = struct.Struct("<4sII")
+    MAGIC_PIXELS = b"BSPX"
+    MAGIC_PCM = b"BSPC"
+    
+    def __init__(self, directory=Config.BAKE_DIR, enabled=Config.BAKE_ENABLED):
+        self.directory = directory
+        self.enabled = enabled
+        self.source_hashes = {}
+        
+        # (directory, module) pairs whose old versions were already pruned
+        self.pruned = set()
+        
+        self.hits = 0
+        self.misses = 0
+    
+    def make_key(self, generator, args, extra=()):
+        """Version subdirectory plus a hash of arguments and screen dimensions"""
+        version = self._version(generator)
+        h = hashlib.sha1(repr((generator.__qualname__, args, extra,
+                               Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)).encode())
+        return f"{version}/{h.hexdigest()}"
+    
+    def _version(self, generator):
+        """Subdirectory name for the generator's module at its current source"""
+        module = inspect.getmodule(generator)
+        name = getattr(module, "__name__", generator.__module__)
+        version = f"{name}.{self._source_hash(generator).hex()[:16]}"
+        if (self.directory, name) not in self.pruned:
+            self.pruned.add((self.directory, name))
+            self._prune(name, version)
+        return version
+    
+    def _prune(self, name, version):
+        """Delete other versions of a module, and files from the flat layout"""
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_dir() and entry.name.startswith(name + ".") and entry.name != version:
+                shutil.rmtree(entry.path, ignore_errors=True)
+            elif entry.is_file() and entry.name.endswith(".bin"):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+    
+    def _source_hash(self, generator):
+        """Digest of the module defining the generator, so helper edits also invalidate"""
+        module = inspect.getmodule(generator)
+        if module not in self.source_hashes:
+            try:
+                source = inspect.getsource(module)
+            except (OSError, TypeError):
+                source = generator.__qualname__
+            self.source_hashes[module] = hashlib.sha1(source.encode()).digest()
+        return self.source_hashes[module]
+    
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".bin")
+    
+    def _map(self, key, magic):
+        """Memory-map a baked file and validate its header"""
+        try:
+            with open(self._path(key), "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None, 0, 0
+        
+        if len(mm) < self.HEADER.size:
+            return None, 0, 0
+        tag, a, b = self.HEADER.unpack_from(mm)
+        if tag != magic:
+            return None, 0, 0
+        return mm, a, b
+    
+    def _write(self, key, magic, a, b, payload):
+        """Write atomically so a concurrent reader never sees a partial file"""
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(self.HEADER.pack(magic, a, b))
+                f.write(payload)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"Error writing bake cache: {e}")
+    
+    def surface_key(self, generator, args, kwargs):
+        return self.make_key(generator, args, tuple(sorted(kwargs.items())))
+    
+    def sound_key(self, generator, args, kwargs, mixer=None):
+        # PCM layout depends on the mixer format
+        mixer = mixer or pygame.mixer.get_init()
+        return self.make_key(generator, args, (tuple(sorted(kwargs.items())), mixer))
+    
+    def load_pixels(self, key):
+        """Baked RGBA view and size, or None"""
+        mm, w, h = self._map(key, self.MAGIC_PIXELS)
+        if mm is None or len(mm) != self.HEADER.size + w * h * 4:
+            return None
+        self.hits += 1
+        return memoryview(mm)[self.HEADER.size:], (w, h)
+    
+    def load_pcm(self, key):
+        """Baked PCM view, or None"""
+        mm, length, _ = self._map(key, self.MAGIC_PCM)
+        if mm is None or len(mm) != self.HEADER.size + length:
+            return None
+        self.hits += 1
+        return memoryview(mm)[self.HEADER.size:]
+    
+    def store_pixels(self, key, size, raw):
+        self._write(key, self.MAGIC_PIXELS, size[0], size[1], raw)
+    
+    def store_pcm(self, key, raw):
+        self._write(key, self.MAGIC_PCM, len(raw), 0, raw)
+    
+    def surface(self, generator, *args, **kwargs):
+        """Get a generated surface, baking it to disk on first use"""
+        if not self.enabled:
+            return generator(*args, **kwargs)
+        
+        key = self.surface_key(generator, args, kwargs)
+        baked = self.load_pixels(key)
+        if baked is not None:
+            # Surface keeps the mapping alive; pages are shared between processes
+            return pygame.image.frombuffer(baked[0], baked[1], "RGBA")
+        
+        self.misses += 1
+        surf = generator(*args, **kwargs)
+        self.store_pixels(key, surf.get_size(), pygame.image.tostring(surf, "RGBA"))
+        return surf
+    
+    def sound(self, generator, *args, **kwargs):
+        """Get a generated sound, baking its PCM to disk on first use"""
+        if not self.enabled:
+            return generator(*args, **kwargs)
+        
+        key = self.sound_key(generator, args, kwargs)
+        baked = self.load_pcm(key)
+        if baked is not None:
+            return pygame.mixer.Sound(buffer=baked)
+        
+        self.misses += 1
+        snd = generator(*args, **kwargs)
+        self.store_pcm(key, snd.get_raw())
+        return snd
+    
+    def clear(self):
+        """Delete every baked file"""
+        if not os.path.isdir(self.directory):
+            return
+        for entry in os.scandir(self.directory):
+            if entry.is_dir():
+                shutil.rmtree(entry.path, ignore_errors=True)
+            elif entry.name.endswith(".bin"):
+                os.remove(entry.path)
+        self.pruned.clear()
+
+
+# Shared instance used by the asset registry and managers
+default_bake_cache = BakeCache()
\ No newline at end of file
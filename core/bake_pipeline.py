@@ -0,0 +1,189 @@
+"""
+Bake Pipeline - parallel procedural asset generation
+Jobs run on a process pool and come back as raw RGBA / PCM buffers
+"""
+import pygame
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from config import Config
+from core.bake_cache import default_bake_cache
+
+
+def bake_pixels(generator, args, kwargs):
+    """Worker: render a surface, return its size and RGBA bytes"""
+    surf = generator(*args, **kwargs)
+    return surf.get_size(), pygame.image.tostring(surf, "RGBA")
+
+
+def bake_pcm(generator, args, kwargs, mixer):
+    """Worker: synthesize PCM for a mixer format, return its bytes"""
+    return None, generator(*args, mixer=mixer, **kwargs).tobytes()
+
+
+class BakeJob:
+    """One asset to produce and the callback that installs it"""
+    
+    def __init__(self, kind, generator, args, kwargs, priority, on_ready, mixer=None):
+        self.kind = kind
+        self.generator = generator
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.on_ready = on_ready
+        self.mixer = mixer
+        self.key = None
+        self.installed = False
+    
+    def task(self):
+        """Worker function and arguments for this job"""
+        if self.kind == "pcm":
+            return bake_pcm, self.generator, self.args, self.kwargs, self.mixer
+        return bake_pixels, self.generator, self.args, self.kwargs
+
+
+class BakePipeline:
+    """Generates independent assets in parallel, most urgent priority first
+    
+    Warm assets are mapped straight from the bake cache; the rest are rendered
+    on worker processes. Results are wrapped into Surfaces/Sounds and passed to
+    their callbacks on the main thread from poll().
+    """
+    
+    TITLE = 0
+    GAMEPLAY = 1
+    
+    def __init__(self, workers=Config.BAKE_WORKERS, cache=default_bake_cache):
+        self.workers = os.cpu_count() if workers is None else workers
+        self.cache = cache
+        self.jobs = []
+        
+        # Cached (job, size, raw) awaiting install; future -> job while on the pool;
+        # jobs generated on this process when there is no pool
+        self.loaded = []
+        self.futures = {}
+        self.inline = []
+        self.executor = None
+        
+        # Jobs served from the cache, and PCM redone on this process for another mixer
+        self.cached = 0
+        self.resynthesized = 0
+    
+    def add_surface(self, generator, *args, priority=GAMEPLAY, on_ready=None, **kwargs):
+        self.jobs.append(BakeJob("pixels", generator, args, kwargs, priority, on_ready))
+    
+    def add_pcm(self, generator, *args, mixer, priority=GAMEPLAY, on_ready=None, **kwargs):
+        """Queue PCM for `mixer` = (frequency, size, channels); on_ready gets a Sound"""
+        self.jobs.append(BakeJob("pcm", generator, args, kwargs, priority, on_ready, mixer))
+    
+    def start(self):
+        """Map cached assets and submit the rest to the pool, by priority
+        
+        Safe to call before pygame.init; nothing is installed until poll().
+        """
+        pending = []
+        for job in sorted(self.jobs, key=lambda j: j.priority):
+            if self.cache.enabled and self._load(job):
+                continue
+            pending.append(job)
+        
+        if pending and self.workers > 0:
+            try:
+                self.executor = ProcessPoolExecutor(self.workers)
+                for job in pending:
+                    self.futures[self.executor.submit(*job.task())] = job
+                return
+            except (OSError, NotImplementedError, ImportError) as e:
+                # No process support on this platform
+                print(f"Bake pool unavailable, generating inline: {e}")
+                self.futures.clear()
+                self.executor = None
+        self.inline = pending
+    
+    def _load(self, job):
+        if job.kind == "pcm":
+            job.key = self.cache.sound_key(job.generator, job.args, job.kwargs, job.mixer)
+            raw = self.cache.load_pcm(job.key)
+            size = None
+        else:
+            job.key = self.cache.surface_key(job.generator, job.args, job.kwargs)
+            baked = self.cache.load_pixels(job.key)
+            raw, size = baked if baked is not None else (None, None)
+        
+        if raw is None:
+            return False
+        self.cached += 1
+        self.loaded.append((job, size, raw))
+        return True
+    
+    def poll(self, timeout=0):
+        """Install finished jobs; waits up to `timeout` seconds for one to finish"""
+        for job, size, raw in self.loaded:
+            self._install(job, size, raw)
+        self.loaded = []
+        
+        if self.futures and timeout:
+            wait(self.futures, timeout, return_when=FIRST_COMPLETED)
+        
+        for future in [f for f in self.futures if f.done()]:
+            job = self.futures.pop(future)
+            try:
+                size, raw = future.result()
+            except Exception as e:
+                # Worker died or the generator failed there; retry on this process
+                print(f"Bake worker failed ({e}), generating inline")
+                self.inline.append(job)
+                continue
+            self._store(job, size, raw)
+            self._install(job, size, raw)
+        
+        # One inline job per poll keeps the loading screen responsive
+        if self.inline:
+            job = self.inline.pop(0)
+            bake, *args = job.task()
+            size, raw = bake(*args)
+            self._store(job, size, raw)
+            self._install(job, size, raw)
+        
+        if self.executor is not None and not self.futures:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+    
+    def _store(self, job, size, raw):
+        if not self.cache.enabled:
+            return
+        if job.kind == "pcm":
+            self.cache.store_pcm(job.key, raw)
+        else:
+            self.cache.store_pixels(job.key, size, raw)
+    
+    def _install(self, job, size, raw):
+        if job.kind == "pcm":
+            if pygame.mixer.get_init() != job.mixer:
+                # Mixer opened with another format; resynthesize for the real one
+                raw = job.generator(*job.args, **job.kwargs).tobytes()
+                self.resynthesized += 1
+            asset = pygame.mixer.Sound(buffer=raw)
+        else:
+            asset = pygame.image.frombuffer(raw, size, "RGBA")
+        
+        job.installed = True
+        if job.on_ready is not None:
+            job.on_ready(asset)
+    
+    def is_ready(self, priority=GAMEPLAY):
+        """True once every job up to `priority` is installed"""
+        return all(job.installed for job in self.jobs if job.priority <= priority)
+    
+    def progress(self):
+        """Fraction of jobs installed"""
+        if not self.jobs:
+            return 1.0
+        return sum(job.installed for job in self.jobs) / len(self.jobs)
+    
+    def close(self):
+        """Stop workers, dropping jobs that have not started"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.futures.clear()
+        self.inline = []
\ No newline at end of file
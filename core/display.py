@@ -0,0 +1,90 @@
+"""
+Display - window, logical screen and the low-resolution world canvas
+The game always draws at Config.SCREEN_WIDTH x SCREEN_HEIGHT; the window may differ
+"""
+import pygame
+from config import Config
+
+
+class Display:
+    """Maps the fixed logical screen onto whatever window was opened
+    
+    When the window matches the logical size the screen is the window itself
+    and dirty-rect updates work as before. Otherwise (fullscreen or another
+    window size) each frame is scaled once into a centered area of the window,
+    by the largest integer factor that fits ("integer") or to fill it ("fit").
+    
+    With Config.CANVAS_SCALE k > 1 the gameplay world is drawn on a canvas k
+    times smaller with sprites made for that size and upscaled once per frame.
+    Arguments left as None are read from Config when the display opens.
+    """
+    
+    def __init__(self, size=None, canvas_scale=None, window_size=None,
+                 fullscreen=None, scale_mode=None):
+        size = size or (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
+        canvas_scale = Config.CANVAS_SCALE if canvas_scale is None else canvas_scale
+        window_size = window_size or Config.WINDOW_SIZE
+        fullscreen = Config.FULLSCREEN if fullscreen is None else fullscreen
+        scale_mode = scale_mode or Config.SCALE_MODE
+        
+        self.size = size
+        if fullscreen:
+            self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            self.window = pygame.display.set_mode(window_size or size)
+        
+        # Logical screen: the window itself when no scaling is needed
+        self.direct = self.window.get_size() == size
+        self.screen = self.window if self.direct else pygame.Surface(size)
+        self.dest = self._fit(self.window.get_size(), scale_mode)
+        self.target = None if self.direct else self.window.subsurface(self.dest)
+        
+        # Letterbox bars around the scaled frame
+        self.bars = [] if self.direct else self._bars()
+        
+        self.canvas_scale = canvas_scale
+        self.canvas = None
+        if canvas_scale > 1:
+            w, h = size
+            self.canvas = pygame.Surface((w // canvas_scale, h // canvas_scale))
+    
+    def _fit(self, window, scale_mode):
+        """Centered rect in the window the logical screen is scaled into"""
+        (ww, wh), (w, h) = window, self.size
+        factor = min(ww / w, wh / h)
+        if scale_mode == "integer" and factor >= 1:
+            factor = int(factor)
+        rect = pygame.Rect(0, 0, round(w * factor), round(h * factor))
+        rect.center = (ww // 2, wh // 2)
+        return rect
+    
+    def _bars(self):
+        ww, wh = self.window.get_size()
+        d = self.dest
+        bars = [pygame.Rect(0, 0, ww, d.top), pygame.Rect(0, d.bottom, ww, wh - d.bottom),
+                pygame.Rect(0, d.top, d.left, d.h), pygame.Rect(d.right, d.top, ww - d.right, d.h)]
+        return [bar for bar in bars if bar.w > 0 and bar.h > 0]
+    
+    def to_logical(self, pos):
+        """Window pixel position (mouse) to logical screen coordinates"""
+        if self.direct:
+            return pos
+        x = (pos[0] - self.dest.x) * self.size[0] // self.dest.w
+        y = (pos[1] - self.dest.y) * self.size[1] // self.dest.h
+        return x, y
+    
+    def upscale_canvas(self, surface):
+        """Scale the world canvas over the whole of `surface` (logical size)"""
+        pygame.transform.scale(self.canvas, surface.get_size(), surface)
+    
+    def present(self, dirty=None):
+        """Show the logical screen: only `dirty` rects when drawn directly, else the full frame"""
+        if not self.direct:
+            for bar in self.bars:
+                self.window.fill(Config.BLACK, bar)
+            pygame.transform.scale(self.screen, self.dest.size, self.target)
+            pygame.display.flip()
+        elif dirty is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Game Clock - fixed-step simulation timing
+Decouples gameplay speed from display frame rate
+"""
+from config import Config
+
+
+class GameClock:
+    """Fixed-timestep accumulator with time scaling
+    
+    Only advanced while playing, so paused time never reaches the simulation.
+    Arguments left as None are read from Config.
+    """
+    
+    def __init__(self, sim_hz=None, time_scale=None, max_steps=None):
+        self.step_ms = 1000.0 / (sim_hz or Config.SIM_HZ)
+        self.time_scale = Config.TIME_SCALE if time_scale is None else time_scale
+        self.max_steps = Config.MAX_SIM_STEPS if max_steps is None else max_steps
+        self.reset()
+    
+    def reset(self):
+        """Start a new session at simulated time zero"""
+        self.now = 0.0
+        self.accumulator = 0.0
+        self.alpha = 0.0
+    
+    def advance(self, real_dt):
+        """Feed elapsed real milliseconds; returns how many fixed steps to run"""
+        self.accumulator += real_dt * self.time_scale
+        steps = int(self.accumulator // self.step_ms)
+        
+        # Bound per-frame sim cost; drop backlog instead of spiralling
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = self.step_ms * steps
+        
+        self.accumulator -= self.step_ms * steps
+        self.alpha = self.accumulator / self.step_ms
+        return steps
+    
+    def step(self):
+        """Mark one fixed step as simulated"""
+        self.now += self.step_ms
\ No newline at end of file
@@ -1,10 +1,23 @@
 import pygame
+import gc
+import random
 import sys
+import numpy as np
 from config import Config, GameState, TrashType
-from core.asset_factory import AssetFactory
+from core.asset_factory import AssetFactory, asset_registry
+from core.bake_pipeline import BakePipeline
+from core.display import Display
+from core.game_clock import GameClock
+from core.profiler import FrameProfiler
+from core.replay import Replay
+from core.run_history import RunHistory
 from core.save_manager import SaveManager
-from audio.sound_manager import SoundManager
+from audio.music import MusicStream
+from audio.sound_manager import AudioFactory, SoundManager
+from entities.particles import ParticleSystem
 from entities.player import Player
+from entities.trash import TrashStore
+from managers.collision_manager import CollisionManager
 from managers.level_manager import LevelManager
 from managers.spawner import Spawner
 from managers.ui_manager import UIManager, UIElement, Cursor
@@ -13,58 +26,87 @@ from managers.ui_manager import UIManager, UIElement, Cursor
 class GameManager:
     
     def __init__(self):
+        # Bake procedural assets on worker processes; started before pygame.init
+        # so forked workers carry no SDL state
+        self.bake = BakePipeline()
+        self._queue_assets()
+        self.bake.start()
+        
+        # Open the mixer in the format the sounds were baked for, or every
+        # baked PCM would be resynthesized on install
+        pygame.mixer.pre_init(*SoundManager.MIXER)
         pygame.init()
-        self.screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+        self.display = Display()
+        self.screen = self.display.screen
+        asset_registry.finalize_all()
         pygame.display.set_caption(Config.TITLE)
         self.clock = pygame.time.Clock()
+        self.game_clock = GameClock()
+        self.profiler = FrameProfiler()
         
-        # Hide system cursor
-        pygame.mouse.set_visible(False)
-        self.cursor = Cursor()
-        
-        # Initialize managers
-        self.sound = SoundManager()
+        # Initialize managers (sound effects arrive from the bake pipeline)
+        self.sound = SoundManager(preload=False)
+        self.music = MusicStream(self.sound.voices.channel("music"))
+        if Config.MUSIC_ENABLED:
+            self.music.start()
         self.save = SaveManager()
+        self.history = RunHistory()
         self.lvl_mgr = LevelManager()
         self.ui = UIManager()
+        self.collision = CollisionManager()
         
-        # Generate backgrounds
-        print("Generating Background Assets...")
-        self.bg_menu = AssetFactory.create_menu_background(Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
-        self.bg_game = AssetFactory.create_game_background(Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
+        # Wait only for what the title screen needs; the rest keeps baking
+        self.bg_menu = None
+        self.bg_game = None
+        self.load_assets(BakePipeline.TITLE)
+        
+        # Hide system cursor
+        pygame.mouse.set_visible(False)
+        self.cursor = Cursor()
         
         # Game state
         self.state = GameState.TITLE
+        self.last_state = None
         self.current_level_num = 1
         
+        # Input waiting for the next sim step, and the session being recorded
+        self.swap_requested = False
+        self.replay = None
+        
+        # Rects drawn last gameplay frame, restored from bg_game next frame
+        self.dirty_prev = []
+        self.dirty_ready = False
+        
         # Initialize UI buttons
         self._init_buttons()
         
         # Reset game session
         self.reset_session()
     
-    def _init_buttons(self):
-        self.buttons = {
+    @staticmethod
+    def _button_specs():
+        """Button layout per screen: (x, y, w, h, text, action, color)"""
+        specs = {
             "title": [
-                UIElement(Config.SCREEN_WIDTH//2 - 100, 400, 200, 50, 
-                         "PLAY", "goto_level_select", Config.GREEN)
+                (Config.SCREEN_WIDTH//2 - 100, 400, 200, 50, 
+                 "PLAY", "goto_level_select", Config.GREEN)
             ],
             "level_select": [],
             "paused": [
-                UIElement(Config.SCREEN_WIDTH//2 - 100, 300, 200, 50, 
-                         "RESUME", "resume", Config.GREEN),
-                UIElement(Config.SCREEN_WIDTH//2 - 100, 370, 200, 50, 
-                         "TITLE", "goto_title", Config.BLUE)
+                (Config.SCREEN_WIDTH//2 - 100, 300, 200, 50, 
+                 "RESUME", "resume", Config.GREEN),
+                (Config.SCREEN_WIDTH//2 - 100, 370, 200, 50, 
+                 "TITLE", "goto_title", Config.BLUE)
             ],
             "game_over": [
-                UIElement(Config.SCREEN_WIDTH//2 - 120, 300, 240, 50, 
-                         "RESTART", "restart", Config.GOLD),
-                UIElement(Config.SCREEN_WIDTH//2 - 120, 370, 240, 50, 
-                         "MENU", "goto_level_select", Config.RED)
+                (Config.SCREEN_WIDTH//2 - 120, 300, 240, 50, 
+                 "RESTART", "restart", Config.GOLD),
+                (Config.SCREEN_WIDTH//2 - 120, 370, 240, 50, 
+                 "MENU", "goto_level_select", Config.RED)
             ],
             "game_finished": [
-                UIElement(Config.SCREEN_WIDTH//2 - 120, 300, 240, 50, 
-                         "CONTINUE", "goto_level_select", Config.GREEN)
+                (Config.SCREEN_WIDTH//2 - 120, 300, 240, 50, 
+                 "CONTINUE", "goto_level_select", Config.GREEN)
             ]
         }
         
@@ -72,18 +114,109 @@ class GameManager:
         for i in range(1, 11):
             x = 150 + ((i-1) % 5) * 100
             y = 250 + ((i-1) // 5) * 80
-            self.buttons["level_select"].append(
-                UIElement(x, y, 80, 60, f"{i}", f"lvl_{i}", Config.GOLD)
-            )
+            specs["level_select"].append((x, y, 80, 60, f"{i}", f"lvl_{i}", Config.GOLD))
         
-        # Back button
-        self.buttons["level_select"].append(
-            UIElement(20, 20, 120, 40, "<BACK", "goto_title", Config.RED)
+        # Trash storm stress level, unlocked by clearing level 10
+        specs["level_select"].append(
+            (Config.SCREEN_WIDTH//2 - 210, 410, 200, 60, "STORM",
+             f"lvl_{LevelManager.STORM_LEVEL}", Config.RED)
+        )
+        # Endless mode, unlocked by clearing the storm
+        specs["level_select"].append(
+            (Config.SCREEN_WIDTH//2 + 10, 410, 200, 60, "ENDLESS",
+             f"lvl_{LevelManager.ENDLESS_LEVEL}", Config.BLUE)
         )
+        
+        # Back button
+        specs["level_select"].append((20, 20, 120, 40, "<BACK", "goto_title", Config.RED))
+        return specs
+    
+    def _init_buttons(self):
+        self.buttons = {}
+        for screen_name, specs in self._button_specs().items():
+            self.buttons[screen_name] = [UIElement(*spec) for spec in specs]
+    
+    def _queue_assets(self):
+        """Queue every procedural asset; what the title screen needs comes first"""
+        title, gameplay = BakePipeline.TITLE, BakePipeline.GAMEPLAY
+        w, h = Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT
+        
+        self.bake.add_surface(AssetFactory.create_menu_background, w, h, priority=title,
+                              on_ready=lambda surf: self._set_background("bg_menu", surf))
+        
+        # World art is made at the canvas resolution when the world is drawn low-res
+        bg_scale = AssetFactory.world_scale(AssetFactory.BG_SCALE) or AssetFactory.BG_SCALE
+        self.bake.add_surface(AssetFactory.create_game_background, w, h, priority=gameplay,
+                              scale=bg_scale, on_ready=lambda surf: self._set_background("bg_game", surf))
+        
+        # Shared sprites go to the asset registry; buttons, cursor and bins are
+        # acquired while the game starts up
+        bin_scale = AssetFactory.world_scale(AssetFactory.BIN_SCALE)
+        trash_scale = AssetFactory.world_scale(AssetFactory.TRASH_SCALE)
+        sprites = [(title, AssetFactory.create_cursor, (), None),
+                   (title, AssetFactory.create_bin_sprite, (Config.GREEN,), bin_scale),
+                   (title, AssetFactory.create_bin_sprite, (Config.BLUE,), bin_scale),
+                   (gameplay, AssetFactory.create_heart_sprite, (), None)]
+        
+        looks = {(bw, bh, color) for specs in self._button_specs().values()
+                 for _, _, bw, bh, _, _, color in specs}
+        for bw, bh, color in sorted(looks):
+            for hover in (False, True):
+                sprites.append((title, AssetFactory.create_button_sprite, (bw, bh, color, hover), None))
+        
+        for t_type in TrashType:
+            for variant in range(1 if t_type == TrashType.BONUS else TrashStore.VARIANTS):
+                sprites.append((gameplay, AssetFactory.create_trash_sprite, (t_type, variant), trash_scale))
+        
+        # Particle sprites are tiny and acquired with the first session
+        particle_scale = AssetFactory.world_scale(AssetFactory.PARTICLE_SCALE)
+        for color in ParticleSystem.COLORS:
+            for size in ParticleSystem.SIZES:
+                sprites.append((title, AssetFactory.create_particle_sprite, (color, size), particle_scale))
+        
+        for priority, generator, args, scale in sprites:
+            kwargs = {} if scale is None else {"scale": scale}
+            self.bake.add_surface(generator, *args, priority=priority, **kwargs,
+                                  on_ready=lambda surf, g=generator, a=args, k=scale:
+                                  asset_registry.preload(surf, g, *a, scale=k))
+        
+        # Sound effects; the click is heard on the title screen
+        for name, variant, params in SoundManager.variant_params():
+            self.bake.add_pcm(AudioFactory.generate_pcm, *params, mixer=SoundManager.MIXER,
+                              priority=title if name == "click" else gameplay,
+                              on_ready=lambda snd, n=name, v=variant: self.sound.set_sound(n, snd, v))
+    
+    def _set_background(self, name, surface):
+        # Backgrounds are opaque: converted without alpha
+        setattr(self, name, AssetFactory.finalize(surface, opaque=True))
+    
+    def load_assets(self, priority=BakePipeline.GAMEPLAY):
+        """Show loading progress until every asset up to `priority` is installed"""
+        while not self.bake.is_ready(priority):
+            self.bake.poll(timeout=1 / Config.FPS)
+            self.music.update()
+            pygame.event.pump()
+            self.draw_loading()
+            self.display.present()
+    
+    def close(self):
+        """Stop the bake pool, music thread and writers; pending saves and runs are written"""
+        self.bake.close()
+        self.music.stop()
+        self.save.close()
+        self.history.close()
     
     def reset_session(self):
+        if hasattr(self, "player"):
+            self.player.release_assets()
+            self.trash.release_assets()
+            self.particles.release_assets()
         self.player = Player()
-        self.trash_group = pygame.sprite.Group()
+        self.trash = TrashStore()
+        self.particles = ParticleSystem()
+        
+        # Every bin that can catch trash (the player's for now)
+        self.bins = [self.player]
         self.spawner = None
         self.stats = {"caught": 0, "missed": 0, "total": 0}
     
@@ -93,15 +226,73 @@ class GameManager:
             return
         
         self.sound.play("click")
-        self.current_level_num = level_num
-        self.reset_session()
-        self.spawner = Spawner(self.lvl_mgr.get_level_data(level_num))
+        self.load_assets()
+        self.begin_level(level_num)
         
         # Show tutorial for first two levels
         if level_num <= 2:
             self.state = GameState.LEVEL_INTRO
-        else:
-            self.state = GameState.PLAYING
+    
+    def begin_level(self, level_num, seed=None, record=True):
+        """Set up a fresh session; the seed fixes every random spawn"""
+        if seed is None:
+            seed = random.getrandbits(64)
+        
+        self.current_level_num = level_num
+        self.reset_session()
+        self.game_clock.reset()
+        self.level_data = self.lvl_mgr.get_level_data(level_num)
+        segments = self.lvl_mgr.endless_segment if self.level_data.get("endless") else None
+        self.spawner = Spawner(self.level_data, random.Random(seed), segments=segments)
+        self.trash.prefetch(self.spawner.sprite_keys())
+        self.swap_requested = False
+        self.replay = Replay(level_num, seed) if record else None
+        self.state = GameState.PLAYING
+        
+        # Move everything loaded so far out of the collector's reach for the level.
+        # Unfreezing first lets the previous sessions' leftovers be collected
+        # instead of staying frozen for good
+        gc.unfreeze()
+        gc.collect()
+        gc.freeze()
+    
+    def level_label(self):
+        """Level number for the HUD; endless mode shows how many segments deep it is"""
+        if self.spawner is not None and self.spawner.segments is not None:
+            return f"E{self.spawner.segment + 1}"
+        return self.current_level_num
+    
+    def music_intensity(self):
+        """0 on menus, rising with trash speed in play (endless mode tops out at 1)"""
+        if self.state != GameState.PLAYING or self.spawner is None:
+            return 0.0
+        return ((self.spawner.base_speed - Config.BASE_TRASH_SPEED)
+                / (LevelManager.ENDLESS_MAX_SPEED - Config.BASE_TRASH_SPEED))
+    
+    def end_session(self, won):
+        """Store the finished session's replay and add it to the run history"""
+        if self.replay is not None:
+            self.replay.finish(self.stats, self.player.health, won)
+            self.replay.save()
+            self.history.record(self.current_level_num, self.stats, self.game_clock.now,
+                                self.replay.seed, won)
+    
+    def play_replay(self, replay):
+        """Re-run a recorded session through update_gameplay as fast as possible
+        
+        Returns the result tuple (caught, total, health, won) to compare with
+        replay.result; nothing is drawn, saved or unlocked.
+        """
+        self.begin_level(replay.level, replay.seed, record=False)
+        step = 1000.0 / replay.sim_hz
+        for move, swap in replay.ticks():
+            self.update_gameplay(step, move, swap)
+            self.game_clock.step()
+            if self.state != GameState.PLAYING:
+                break
+        
+        won = self.state == GameState.GAME_FINISHED
+        return (self.stats["caught"], self.stats["total"], self.player.health, won)
     
     def handle_click(self, action):
         self.sound.play("click")
@@ -118,171 +309,289 @@ class GameManager:
             level = int(action.split("_")[1])
             self.start_level(level)
     
-    def handle_collision(self, trash):
+    def handle_collision(self, player, t_type, bottom, x):
         # Check if trash entered through the lid (top collision)
-        lid_threshold = self.player.rect.top + 15
+        lid_threshold = player.rect.top + Config.LID_DEPTH
         
-        if trash.rect.bottom <= lid_threshold:
+        if bottom <= lid_threshold:
             # Entered through lid - check type match
-            trash.kill()
-            
-            if trash.type == TrashType.BONUS:
-                self.player.heal()
+            if t_type == TrashType.BONUS:
+                player.heal()
                 self.sound.play("bonus")
-            elif trash.type == self.player.current_type:
+                self.emit_effect("bonus", x, player.rect.top)
+            elif t_type == player.current_type:
                 self.stats['caught'] += 1
                 self.stats['total'] += 1
                 self.sound.play("catch")
+                self.emit_effect(f"catch_{t_type.name.lower()}", x, player.rect.top)
             else:
-                self.player.take_damage()
-                self.stats['total'] += 1
-                self.sound.play("hurt")
+                self.penalize(player=player)
+                self.emit_effect("hurt", x, player.rect.top)
         else:
             # Hit the side - always hurts (unless bonus)
-            trash.kill()
-            if trash.type != TrashType.BONUS:
-                self.player.take_damage()
-                self.stats['total'] += 1
-                self.sound.play("hurt")
+            if t_type != TrashType.BONUS:
+                self.penalize(player=player)
+                self.emit_effect("hurt", x, bottom)
+    
+    def emit_effect(self, effect, x, y):
+        if Config.PARTICLES_ENABLED:
+            self.particles.emit(effect, x, y)
     
-    def update_gameplay(self, dt):
-        keys = pygame.key.get_pressed()
-        self.player.update(keys, dt)
-        self.spawner.update(pygame.time.get_ticks(), self.trash_group)
-        self.trash_group.update()
+    def penalize(self, count=1, player=None):
+        """Count failed items and take damage (storm level only scores)"""
+        player = player or self.player
+        self.stats['total'] += count
+        if self.level_data.get("damage", True):
+            for _ in range(count):
+                player.take_damage()
+        self.sound.play("hurt")
+    
+    def update_gameplay(self, dt, move=0, swap=False):
+        """Advance gameplay by one fixed step of dt sim milliseconds
+        
+        move: -1, 0 or 1 horizontal input; swap: bin swap requested this step.
+        """
+        if self.replay is not None:
+            self.replay.record(move, swap)
+        
+        if swap and self.player.swap_bin(self.game_clock.now):
+            self.sound.play("swap")
+        self.player.update(move, dt)
+        self.spawner.update(self.game_clock.now, self.trash)
+        self.trash.update(dt)
+        self.particles.update(dt)
+        self.profiler.mark(FrameProfiler.UPDATE)
         
         # Check collisions
-        hits = pygame.sprite.spritecollide(self.player, self.trash_group, False)
-        for trash in hits:
-            self.handle_collision(trash)
-        
-        # Check missed trash
-        for trash in self.trash_group:
-            if trash.is_offscreen():
-                trash.kill()
-                if trash.type != TrashType.BONUS:
-                    self.player.take_damage()
-                    self.stats['total'] += 1
-                    self.sound.play("hurt")
+        owners, hits = self.collision.pairs(self.trash, self.bins)
+        if hits.size:
+            bottoms = np.trunc(self.trash.y[hits]) + Config.TRASH_SIZE
+            centers = self.trash.x[hits] + Config.TRASH_SIZE // 2
+            for b, i, bottom, x in zip(owners.tolist(), hits.tolist(), bottoms.tolist(), centers.tolist()):
+                self.handle_collision(self.bins[b], self.trash.get_type(i), bottom, x)
+        
+        # Check missed trash (bins sit on screen, so hits are never offscreen)
+        missed = self.trash.offscreen()
+        if missed.size:
+            penalized = missed[self.trash.type[missed] != TrashType.BONUS.value]
+            penalties = int(penalized.size)
+            if penalties:
+                self.stats['missed'] += penalties
+                self.penalize(penalties)
+                for x in (self.trash.x[penalized] + Config.TRASH_SIZE // 2).tolist():
+                    self.emit_effect("dust", x, Config.SCREEN_HEIGHT)
+        
+        if hits.size or missed.size:
+            self.trash.remove(np.concatenate((hits, missed)))
+        self.profiler.mark(FrameProfiler.COLLISION)
         
         # Check game over
         if not self.player.is_alive():
             self.state = GameState.GAME_OVER
+            self.end_session(False)
         
         # Check level complete
-        if self.spawner.is_finished() and not self.trash_group and self.player.is_alive():
+        if self.spawner.is_finished() and not self.trash and self.player.is_alive():
             self.state = GameState.GAME_FINISHED
-            # Unlock next level
-            self.save.unlock_level(self.current_level_num + 1)
+            self.end_session(True)
+            # Record the clear and unlock next level (replay playback leaves progress alone)
+            if self.replay is not None:
+                self.save.record_clear(self.current_level_num, self.stats['caught'],
+                                       self.stats['total'], round(self.game_clock.now))
+                self.save.unlock_level(self.current_level_num + 1)
             # self.state = GameState.LEVEL_SELECT
     
+    def _hover_signature(self, screen_name, mouse_pos):
+        """Update button hover states; returns them for cache invalidation"""
+        return tuple(btn.check_hover(mouse_pos) for btn in self.buttons[screen_name])
+    
+    def _draw_buttons(self, surface, screen_name):
+        for btn in self.buttons[screen_name]:
+            btn.draw(surface, self.ui)
+    
+    def _draw_dim(self, surface):
+        surface.blit(self.ui.get_shade((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT), 128), (0, 0))
+    
+    def draw_loading(self):
+        """Draw asset loading progress"""
+        self.screen.fill(Config.BLACK)
+        self.ui.draw_text(self.screen, "LOADING...", 30, 
+                         Config.SCREEN_WIDTH//2, Config.SCREEN_HEIGHT//2 - 40, Config.WHITE, True)
+        self._draw_progress(self.screen, Config.SCREEN_WIDTH//2 - 150, Config.SCREEN_HEIGHT//2, 300, 24)
+    
+    def _draw_progress(self, surface, x, y, w, h):
+        pygame.draw.rect(surface, Config.WHITE, (x, y, w, h), 2)
+        fill = int((w - 8) * self.bake.progress())
+        if fill > 0:
+            pygame.draw.rect(surface, Config.GREEN, (x + 4, y + 4, fill, h - 8))
+    
     def draw_title_screen(self, mouse_pos):
-        self.screen.blit(self.bg_menu, (0, 0))
-        self.ui.draw_text(self.screen, Config.TITLE, 50, 
+        signature = (self._hover_signature("title", mouse_pos), self.bake.progress())
+        self.ui.draw_composed(self.screen, "title", signature, self._render_title_screen)
+    
+    def _render_title_screen(self, surface):
+        surface.blit(self.bg_menu, (0, 0))
+        self.ui.draw_text(surface, Config.TITLE, 50, 
                          Config.SCREEN_WIDTH//2, 200, Config.GREEN, True)
+        self._draw_buttons(surface, "title")
         
-        for btn in self.buttons["title"]:
-            btn.check_hover(mouse_pos)
-            btn.draw(self.screen, self.ui)
+        # Gameplay assets still baking in the background
+        if not self.bake.is_ready():
+            self._draw_progress(surface, Config.SCREEN_WIDTH//2 - 100, Config.SCREEN_HEIGHT - 50, 200, 14)
     
     def draw_level_select(self, mouse_pos):
-        self.screen.blit(self.bg_menu, (0, 0))
-        self.ui.draw_text(self.screen, "SELECT LEVEL", 30, 
+        signature = (self._hover_signature("level_select", mouse_pos), self.save.get_unlocked_level())
+        self.ui.draw_composed(self.screen, "level_select", signature, self._render_level_select)
+    
+    def _render_level_select(self, surface):
+        surface.blit(self.bg_menu, (0, 0))
+        self.ui.draw_text(surface, "SELECT LEVEL", 30, 
                          Config.SCREEN_WIDTH//2, 150, Config.WHITE, True)
         
         for btn in self.buttons["level_select"]:
-            btn.check_hover(mouse_pos)
-            btn.draw(self.screen, self.ui)
+            btn.draw(surface, self.ui)
             
             # Lock unavailable levels
             if btn.action_code.startswith("lvl_"):
                 level = int(btn.action_code.split("_")[1])
                 if level > self.save.get_unlocked_level():
-                    s = pygame.Surface((btn.rect.w, btn.rect.h), pygame.SRCALPHA)
-                    s.fill((0, 0, 0, 150))
-                    self.screen.blit(s, btn.rect)
+                    surface.blit(self.ui.get_shade(btn.rect.size, 150), btn.rect)
     
     def draw_level_intro(self):
+        self.ui.draw_composed(self.screen, "level_intro", self.current_level_num, self._render_level_intro)
+    
+    def _render_level_intro(self, surface):
         # Dim background
-        self.draw_gameplay()
-        s = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 128))
-        self.screen.blit(s, (0, 0))
+        self.draw_gameplay(surface)
+        self._draw_dim(surface)
         
-        self.ui.draw_text(self.screen, f"LEVEL {self.current_level_num}", 40, 
+        self.ui.draw_text(surface, f"LEVEL {self.current_level_num}", 40, 
                          Config.SCREEN_WIDTH//2, 150, Config.WHITE, True)
         
         # Instructions
-        self.ui.draw_text(self.screen, "[ A ] or [ < ] to Move Left", 23, 
+        self.ui.draw_text(surface, "[ A ] or [ < ] to Move Left", 23, 
                          Config.SCREEN_WIDTH//2, 250, Config.WHITE, True)
-        self.ui.draw_text(self.screen, "[ D ]  or [ > ] to Move Right", 23, 
+        self.ui.draw_text(surface, "[ D ]  or [ > ] to Move Right", 23, 
                          Config.SCREEN_WIDTH//2, 300, Config.WHITE, True)
         
         cd_secs = Config.SWAP_COOLDOWN / 1000.0
-        self.ui.draw_text(self.screen, f"[ E ]  Swap Bin (CD: {cd_secs}s)", 23, 
+        self.ui.draw_text(surface, f"[ E ]  Swap Bin (CD: {cd_secs}s)", 23, 
                          Config.SCREEN_WIDTH//2, 350, Config.GOLD, True)
         
-        self.ui.draw_text(self.screen, "Press ANY KEY to Start", 20, 
+        self.ui.draw_text(surface, "Press ANY KEY to Start", 20, 
                          Config.SCREEN_WIDTH//2, 500, Config.GREEN, True)
     
-    def draw_gameplay(self):
+    def draw_gameplay(self, surface=None):
         """Draw gameplay screen"""
-        self.screen.blit(self.bg_game, (0, 0))
-        self.screen.blit(self.player.image, self.player.rect)
-        self.trash_group.draw(self.screen)
-        self.ui.draw_hud(self.screen, self.player, self.stats, self.current_level_num)
+        surface = surface or self.screen
+        canvas = self.display.canvas
+        if canvas is None:
+            surface.blit(self.bg_game, (0, 0))
+            rects = self._draw_world(surface)
+            return rects + self._draw_hud(surface)
+        
+        # Low-res world: one upscale covers the whole screen, the HUD stays sharp
+        canvas.blit(self.bg_game, (0, 0))
+        self._draw_world(canvas, self.display.canvas_scale)
+        self.display.upscale_canvas(surface)
+        return [surface.get_rect()] + self._draw_hud(surface)
+    
+    def draw_gameplay_dirty(self):
+        """Redraw gameplay over last frame, restoring only previously drawn areas"""
+        if not self.dirty_rects_enabled():
+            return self.draw_gameplay()
+        for rect in self.dirty_prev:
+            self.screen.blit(self.bg_game, rect, rect)
+        rects = self._draw_world(self.screen)
+        return rects + self._draw_hud(self.screen)
+    
+    def _draw_world(self, surface, canvas_scale=1):
+        """Draw player and trash; returns the rects they cover on `surface`"""
+        alpha = self.game_clock.alpha
+        x, y = self.player.render_pos(alpha)
+        rects = [surface.blit(self.player.image, (x // canvas_scale, y // canvas_scale))]
+        rects.extend(self.trash.draw(surface, alpha, canvas_scale))
+        rects.extend(self.particles.draw(surface, canvas_scale))
+        self.profiler.mark(FrameProfiler.DRAW)
+        return rects
+    
+    def _draw_hud(self, surface):
+        rects = self.ui.draw_hud(surface, self.player, self.stats, self.level_label())
+        self.profiler.mark(FrameProfiler.HUD)
+        return rects
+    
+    def dirty_rects_enabled(self):
+        """Dirty rects only pay off when the screen is the window, at full resolution"""
+        return Config.DIRTY_RECTS and self.display.direct and self.display.canvas is None
+    
+    def present(self, drawn):
+        """Push frame to display: dirty rects during gameplay, full flip otherwise"""
+        if drawn is None or not self.dirty_rects_enabled():
+            self.dirty_prev = []
+            self.dirty_ready = False
+            self.display.present()
+            return
+        
+        # Areas to update are where things were last frame and where they are now
+        dirty = self.dirty_prev + drawn
+        full_frame = not self.dirty_ready
+        self.dirty_prev = drawn
+        self.dirty_ready = True
+        
+        area = sum(r.w * r.h for r in dirty)
+        if full_frame or area > Config.DIRTY_RECT_MAX_AREA * Config.SCREEN_WIDTH * Config.SCREEN_HEIGHT:
+            self.display.present()
+        else:
+            self.display.present(dirty)
     
     def draw_paused(self, mouse_pos):
         """Draw pause screen"""
-        self.draw_gameplay()
-        
-        # Dim overlay
-        s = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 128))
-        self.screen.blit(s, (0, 0))
+        signature = self._hover_signature("paused", mouse_pos)
+        self.ui.draw_composed(self.screen, "paused", signature, self._render_paused)
+    
+    def _render_paused(self, surface):
+        self.draw_gameplay(surface)
+        self._draw_dim(surface)
         
-        self.ui.draw_text(self.screen, "PAUSED", 40, 
+        self.ui.draw_text(surface, "PAUSED", 40, 
                          Config.SCREEN_WIDTH//2, 200, Config.WHITE, True)
-        
-        for btn in self.buttons["paused"]:
-            btn.check_hover(mouse_pos)
-            btn.draw(self.screen, self.ui)
+        self._draw_buttons(surface, "paused")
     
     def draw_game_over(self, mouse_pos):
         """Draw game over screen"""
+        signature = self._hover_signature("game_over", mouse_pos)
+        self.ui.draw_composed(self.screen, "game_over", signature, self._render_game_over)
+    
+    def _render_game_over(self, surface):
         # Dim overlay
-        s = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 128))
-        self.screen.blit(s, (0, 0))
+        surface.fill(Config.BLACK)
+        self._draw_dim(surface)
         
-        self.ui.draw_text(self.screen, "GAME OVER", 50, 
+        self.ui.draw_text(surface, "GAME OVER", 50, 
                          Config.SCREEN_WIDTH//2, 200, Config.RED, True)
-        
-        for btn in self.buttons["game_over"]:
-            btn.check_hover(mouse_pos)
-            btn.draw(self.screen, self.ui)
-
+        self._draw_buttons(surface, "game_over")
+    
     def draw_game_finished(self, mouse_pos):
         """Draw game finished screen"""
+        signature = self._hover_signature("game_finished", mouse_pos)
+        self.ui.draw_composed(self.screen, "game_finished", signature, self._render_game_finished)
+    
+    def _render_game_finished(self, surface):
         # Dim overlay
-        self.draw_gameplay()
-        s = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 128))
-        self.screen.blit(s, (0, 0))
+        self.draw_gameplay(surface)
+        self._draw_dim(surface)
         
-        self.ui.draw_text(self.screen, "LEVEL COMPLETE!", 50, 
+        self.ui.draw_text(surface, "LEVEL COMPLETE!", 50, 
                          Config.SCREEN_WIDTH//2, 200, Config.GREEN, True)
-        
-        for btn in self.buttons["game_finished"]:
-            btn.check_hover(mouse_pos)
-            btn.draw(self.screen, self.ui)
+        self._draw_buttons(surface, "game_finished")
     
     def run(self):
         running = True
         
         while running:
             dt = self.clock.tick(Config.FPS)
-            mouse_pos = pygame.mouse.get_pos()
+            self.profiler.begin_frame()
+            mouse_pos = self.display.to_logical(pygame.mouse.get_pos())
             
             # Event handling
             for event in pygame.event.get():
@@ -321,10 +630,9 @@ class GameManager:
                         elif self.state == GameState.PAUSED:
                             self.state = GameState.PLAYING
                     
-                    # Swap bin
+                    # Swap bin on the next sim step
                     if self.state == GameState.PLAYING and event.key == pygame.K_e:
-                        if self.player.swap_bin():
-                            self.sound.play("swap")
+                        self.swap_requested = True
                     
                     # Game over shortcuts
                     if self.state == GameState.GAME_OVER:
@@ -337,24 +645,50 @@ class GameManager:
                     if self.state == GameState.GAME_FINISHED:
                         if event.key == pygame.K_b:
                             self.state = GameState.LEVEL_SELECT
+                    
+                    # Profiler overlay / trace dump
+                    if event.key == pygame.K_F3:
+                        self.profiler.toggle()
+                    elif event.key == pygame.K_F4:
+                        self.profiler.dump_trace()
             
             # Update
-            self.cursor.update()
+            self.cursor.update(mouse_pos)
+            if not self.bake.is_ready():
+                self.bake.poll()
+            self.music.follow(self.music_intensity())
+            self.music.update()
+            self.profiler.mark(FrameProfiler.EVENTS)
             
+            # Fixed-step simulation; sim time only advances while playing
             if self.state == GameState.PLAYING:
-                self.update_gameplay(dt)
+                move = Player.read_move(pygame.key.get_pressed())
+                for _ in range(self.game_clock.advance(dt)):
+                    self.update_gameplay(self.game_clock.step_ms, move, self.swap_requested)
+                    self.swap_requested = False
+                    self.game_clock.step()
+                    if self.state != GameState.PLAYING:
+                        break
+            self.profiler.mark(FrameProfiler.UPDATE)
             
-            # Drawing
-            self.screen.fill(Config.BLACK)
+            # Retained screens are rebuilt after any state transition
+            if self.state != self.last_state:
+                self.ui.invalidate_screens()
+                self.last_state = self.state
             
-            if self.state == GameState.TITLE:
+            # Drawing
+            drawn = None
+            if self.state == GameState.PLAYING:
+                if self.dirty_ready and self.dirty_rects_enabled():
+                    drawn = self.draw_gameplay_dirty()
+                else:
+                    drawn = self.draw_gameplay()
+            elif self.state == GameState.TITLE:
                 self.draw_title_screen(mouse_pos)
             elif self.state == GameState.LEVEL_SELECT:
                 self.draw_level_select(mouse_pos)
             elif self.state == GameState.LEVEL_INTRO:
                 self.draw_level_intro()
-            elif self.state == GameState.PLAYING:
-                self.draw_gameplay()
             elif self.state == GameState.PAUSED:
                 self.draw_paused(mouse_pos)
             elif self.state == GameState.GAME_OVER:
@@ -362,11 +696,23 @@ class GameManager:
             elif self.state == GameState.GAME_FINISHED:
                 self.draw_game_finished(mouse_pos)
             
+            if self.profiler.enabled:
+                voices = self.sound.voices
+                notes = (f"voices {voices.played}/{voices.dropped}/{voices.stolen}",
+                         f"music underruns {self.music.underruns} fx {len(self.particles)}")
+                overlay_rect = self.profiler.draw_overlay(self.screen, self.ui, notes)
+                if drawn is not None:
+                    drawn.append(overlay_rect)
+            
             # Always draw cursor on top
-            self.cursor.draw(self.screen)
-            pygame.display.flip()
+            cursor_rect = self.cursor.draw(self.screen)
+            if drawn is not None and cursor_rect is not None:
+                drawn.append(cursor_rect)
+            self.profiler.mark(FrameProfiler.DRAW)
+            self.present(drawn)
+            self.profiler.mark(FrameProfiler.PRESENT)
         
         # Cleanup
-        self.save.save()
+        self.close()
         pygame.quit()
         sys.exit()
\ No newline at end of file
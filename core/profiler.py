@@ -0,0 +1,173 @@
+"""
+Frame Profiler - per-phase timings of the main loop
+Recorded into fixed-size ring buffers, shown as an overlay or dumped as a Chrome trace
+"""
+import pygame
+import json
+import os
+import time
+import numpy as np
+from config import Config
+
+
+class FrameProfiler:
+    """Ring buffer of per-frame phase timings
+    
+    mark(phase) charges the time since the previous mark to that phase, so a
+    phase run several times per frame (fixed sim steps) accumulates. While
+    disabled, begin_frame and mark are no-op instance attributes.
+    """
+    
+    PHASES = ("events", "update", "collision", "draw", "hud", "present")
+    EVENTS, UPDATE, COLLISION, DRAW, HUD, PRESENT = range(len(PHASES))
+    SPANS_PER_FRAME = 32
+    
+    # Overlay layout
+    PANEL_SIZE = (270, 184)
+    GRAPH_FRAMES = 120
+    GRAPH_HEIGHT = 50
+    GRAPH_MAX_MS = 1000 / 30
+    STATS_INTERVAL = 15
+    
+    def __init__(self, frames=None, enabled=None):
+        frames = frames or Config.PROFILER_FRAMES
+        self.frames = frames
+        phases = len(self.PHASES)
+        
+        # Per frame: phase totals and busy time in ms, start in perf_counter seconds
+        self.timings = np.zeros((frames, phases))
+        self.frame_ms = np.zeros(frames)
+        self.frame_start = np.zeros(frames)
+        
+        # Individual phase spans for the trace export
+        capacity = frames * self.SPANS_PER_FRAME
+        self.span_phase = np.zeros(capacity, dtype=np.int8)
+        self.span_start = np.zeros(capacity)
+        self.span_ms = np.zeros(capacity)
+        
+        self.stat_lines = []
+        self.set_enabled(Config.PROFILER_ENABLED if enabled is None else enabled)
+    
+    def set_enabled(self, enabled):
+        """Turn recording on (starting a fresh buffer) or off"""
+        self.enabled = enabled
+        self.count = 0
+        self.spans = 0
+        self.row = 0
+        self.last = time.perf_counter()
+        self.stat_lines = []
+        if enabled:
+            # Drop the no-op overrides so the class methods are used
+            self.__dict__.pop("begin_frame", None)
+            self.__dict__.pop("mark", None)
+            self.begin_frame()
+        else:
+            self.begin_frame = self._noop
+            self.mark = self._noop
+    
+    def toggle(self):
+        self.set_enabled(not self.enabled)
+    
+    def _noop(self, *args):
+        pass
+    
+    def begin_frame(self):
+        """Close the current frame and start recording the next"""
+        now = time.perf_counter()
+        if self.count:
+            self.frame_ms[self.row] = (self.last - self.frame_start[self.row]) * 1000
+        
+        self.row = self.count % self.frames
+        self.count += 1
+        self.timings[self.row] = 0
+        self.frame_start[self.row] = now
+        self.last = now
+    
+    def mark(self, phase):
+        """Charge time since the previous mark to `phase`"""
+        now = time.perf_counter()
+        ms = (now - self.last) * 1000
+        self.timings[self.row, phase] += ms
+        
+        i = self.spans % len(self.span_ms)
+        self.span_phase[i] = phase
+        self.span_start[i] = self.last
+        self.span_ms[i] = ms
+        self.spans += 1
+        self.last = now
+    
+    def recorded(self):
+        """Completed frame rows, oldest first"""
+        done = min(self.count - 1, self.frames - 1)
+        if done <= 0:
+            return np.zeros(0, dtype=np.intp)
+        return (np.arange(self.count - 1 - done, self.count - 1)) % self.frames
+    
+    def percentiles(self, q=(50, 95, 99)):
+        """Per-phase percentiles over the buffer, shape (len(q), phases)"""
+        rows = self.recorded()
+        if rows.size == 0:
+            return None
+        return np.percentile(self.timings[rows], q, axis=0)
+    
+    def draw_overlay(self, surface, ui, notes=()):
+        """Draw frame-time graph, phase percentiles and up to two note lines;
+        returns the covered rect"""
+        w, h = self.PANEL_SIZE
+        x = Config.SCREEN_WIDTH - w - 10
+        y = 95
+        rect = surface.blit(ui.get_shade(self.PANEL_SIZE, 170), (x, y))
+        
+        # Frame-time graph with a 60 FPS guide line
+        rows = self.recorded()[-self.GRAPH_FRAMES:]
+        base = y + 10 + self.GRAPH_HEIGHT
+        scale = self.GRAPH_HEIGHT / self.GRAPH_MAX_MS
+        guide = base - int(1000 / 60 * scale)
+        pygame.draw.line(surface, Config.GOLD, (x + 10, guide), (x + w - 10, guide))
+        if rows.size > 1:
+            heights = np.minimum(self.frame_ms[rows], self.GRAPH_MAX_MS) * scale
+            xs = x + 10 + np.arange(rows.size) * ((w - 20) / (self.GRAPH_FRAMES - 1))
+            pygame.draw.lines(surface, Config.GREEN, False, np.column_stack((xs, base - heights)).tolist())
+        
+        # Percentile table, refreshed every few frames
+        if self.count % self.STATS_INTERVAL == 0 or not self.stat_lines:
+            stats = self.percentiles()
+            self.stat_lines = ["phase      p50   p95   p99"]
+            if stats is not None:
+                for phase, name in enumerate(self.PHASES):
+                    p50, p95, p99 = stats[:, phase]
+                    self.stat_lines.append(f"{name:<9}{p50:>5.1f} {p95:>5.1f} {p99:>5.1f}")
+        
+        text_y = base + 8
+        for line in self.stat_lines + list(notes):
+            ui.draw_glyphs(surface, line, 8, x + 10, text_y)
+            text_y += 12
+        return rect
+    
+    def dump_trace(self, path=None):
+        """Write recorded spans as Chrome trace_event JSON, to Config.TRACE_FILE by default; returns the path"""
+        path = path or Config.TRACE_FILE
+        capacity = len(self.span_ms)
+        count = min(self.spans, capacity)
+        order = (np.arange(self.spans - count, self.spans)) % capacity
+        
+        events = []
+        for phase, start, ms in zip(self.span_phase[order].tolist(),
+                                    self.span_start[order].tolist(),
+                                    self.span_ms[order].tolist()):
+            events.append({"name": self.PHASES[phase], "cat": "frame", "ph": "X",
+                           "ts": start * 1e6, "dur": ms * 1000, "pid": 1, "tid": 1})
+        
+        for row in self.recorded().tolist():
+            events.append({"name": "frame", "cat": "frame", "ph": "X",
+                           "ts": self.frame_start[row] * 1e6, "dur": self.frame_ms[row] * 1000,
+                           "pid": 1, "tid": 0})
+        
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w") as f:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+            print(f"Frame trace written to {path}")
+        except OSError as e:
+            print(f"Error writing frame trace: {e}")
+        return path
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+Replay - deterministic session recording
+A seed plus one input byte per fixed sim step reproduces a session exactly
+"""
+import os
+import struct
+from config import Config
+
+
+class Replay:
+    """Recorded session: level, seed, per-tick input and the final result
+    
+    File layout: header, one byte per tick (bits 0-1 move, bit 2 swap),
+    then a footer with the result used to verify playback.
+    """
+    
+    MAGIC = b"BSRP"
+    VERSION = 1
+    # magic, version, level, seed, sim_hz, ticks
+    HEADER = struct.Struct("<4sHHQHI")
+    # ended, caught, total, health, won
+    FOOTER = struct.Struct("<BIIhB")
+    
+    MOVES = (0, -1, 1)
+    MOVE_CODES = {0: 0, -1: 1, 1: 2}
+    SWAP_BIT = 4
+    
+    def __init__(self, level, seed, sim_hz=Config.SIM_HZ, max_ticks=Config.REPLAY_MAX_TICKS):
+        self.level = level
+        self.seed = seed
+        self.sim_hz = sim_hz
+        self.max_ticks = max_ticks
+        self.inputs = bytearray()
+        
+        # (caught, total, health, won) once the session ends
+        self.result = None
+        self.truncated = False
+    
+    def __len__(self):
+        return len(self.inputs)
+    
+    def record(self, move, swap):
+        if len(self.inputs) >= self.max_ticks:
+            # Bounded history: keep the start, drop the rest of a very long session
+            self.truncated = True
+            return
+        self.inputs.append(self.MOVE_CODES[move] | (self.SWAP_BIT if swap else 0))
+    
+    def finish(self, stats, health, won):
+        """Store the result, unless the input was cut short and cannot reach it"""
+        if not self.truncated:
+            self.result = (stats["caught"], stats["total"], health, bool(won))
+    
+    def ticks(self):
+        """(move, swap) for every recorded tick"""
+        for code in self.inputs:
+            yield self.MOVES[code & 3], bool(code & self.SWAP_BIT)
+    
+    def to_bytes(self):
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, self.level, self.seed,
+                                  self.sim_hz, len(self.inputs))
+        footer = self.FOOTER.pack(self.result is not None, *(self.result or (0, 0, 0, 0)))
+        return header + bytes(self.inputs) + footer
+    
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, level, seed, sim_hz, ticks = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Not a BinSort replay (or unsupported version)")
+        if len(data) != cls.HEADER.size + ticks + cls.FOOTER.size:
+            raise ValueError("Truncated replay")
+        
+        replay = cls(level, seed, sim_hz)
+        start = cls.HEADER.size
+        replay.inputs = bytearray(data[start:start + ticks])
+        ended, caught, total, health, won = cls.FOOTER.unpack_from(data, start + ticks)
+        if ended:
+            replay.result = (caught, total, health, bool(won))
+        return replay
+    
+    def save(self, path=None):
+        path = path or Config.REPLAY_FILE
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(self.to_bytes())
+        except OSError as e:
+            print(f"Error saving replay: {e}")
+    
+    @classmethod
+    def load(cls, path=None):
+        with open(path or Config.REPLAY_FILE, "rb") as f:
+            return cls.from_bytes(f.read())
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Run History - every finished or failed run in a local SQLite database
+Runs are queued from the game loop and inserted in batches on a writer thread
+"""
+import os
+import sqlite3
+import threading
+import time
+from config import Config
+
+
+class RunHistory:
+    """Append-only run log with leaderboard and per-level summary queries
+    
+    runs_leaderboard indexes (level, caught DESC, duration_ms) so a top-N query
+    reads N index entries; level_stats is kept up to date in the same
+    transaction as the inserts, so per-level aggregates never scan the runs.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            level INTEGER NOT NULL,
+            caught INTEGER NOT NULL,
+            missed INTEGER NOT NULL,
+            total INTEGER NOT NULL,
+            duration_ms INTEGER NOT NULL,
+            seed INTEGER NOT NULL,
+            won INTEGER NOT NULL,
+            played_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS runs_leaderboard ON runs (level, caught DESC, duration_ms);
+        CREATE TABLE IF NOT EXISTS level_stats (
+            level INTEGER PRIMARY KEY,
+            runs INTEGER NOT NULL,
+            wins INTEGER NOT NULL,
+            caught INTEGER NOT NULL,
+            total INTEGER NOT NULL,
+            best INTEGER NOT NULL
+        );
+    """
+    
+    INSERT_RUN = """
+        INSERT INTO runs (level, caught, missed, total, duration_ms, seed, won, played_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    UPDATE_STATS = """
+        INSERT INTO level_stats (level, runs, wins, caught, total, best) VALUES (?, 1, ?, ?, ?, ?)
+        ON CONFLICT (level) DO UPDATE SET
+            runs = runs + 1, wins = wins + excluded.wins, caught = caught + excluded.caught,
+            total = total + excluded.total, best = MAX(best, excluded.best)
+    """
+    TOP_RUNS = """
+        SELECT caught, total, duration_ms, won, played_at FROM runs
+        WHERE level = ? ORDER BY caught DESC, duration_ms LIMIT ?
+    """
+    
+    def __init__(self, path=None):
+        self.path = path or Config.HISTORY_FILE
+        data_dir = os.path.dirname(self.path)
+        if data_dir:
+            os.makedirs(data_dir, exist_ok=True)
+        
+        # Runs waiting for the writer; guarded by the condition's lock
+        self.lock = threading.Condition()
+        self.pending = []
+        self.closed = False
+        self.written = 0
+        
+        # Read connection for this thread; the writer opens its own
+        self.db = self._connect()
+        self.db.executescript(self.SCHEMA)
+        self.writer = threading.Thread(target=self._write_loop, name="history-writer", daemon=True)
+        self.writer.start()
+    
+    def _connect(self):
+        db = sqlite3.connect(self.path)
+        # WAL lets leaderboard reads run while the writer commits
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+    
+    def record(self, level, stats, duration_ms, seed, won):
+        """Queue a finished run; returns immediately"""
+        # SQLite integers are signed 64-bit; store the seed's bit pattern
+        if seed >= 1 << 63:
+            seed -= 1 << 64
+        run = (level, stats["caught"], stats["missed"], stats["total"], round(duration_ms),
+               seed, int(won), time.time())
+        with self.lock:
+            self.pending.append(run)
+            self.lock.notify()
+    
+    def _write_loop(self):
+        db = self._connect()
+        while True:
+            with self.lock:
+                while not self.pending and not self.closed:
+                    self.lock.wait()
+                if not self.pending:
+                    break
+                closing = self.closed
+            
+            # Runs queued close together go in one transaction
+            if not closing:
+                time.sleep(Config.HISTORY_BATCH_MS / 1000)
+            
+            with self.lock:
+                batch, self.pending = self.pending, []
+            try:
+                with db:
+                    db.executemany(self.INSERT_RUN, batch)
+                    db.executemany(self.UPDATE_STATS, [(run[0], run[6], run[1], run[3], run[1])
+                                                       for run in batch])
+                self.written += len(batch)
+            except sqlite3.Error as e:
+                print(f"Error saving run history: {e}")
+        db.close()
+    
+    def top_runs(self, level, limit=10):
+        """Best runs of a level: (caught, total, duration_ms, won, played_at), best first"""
+        return self.db.execute(self.TOP_RUNS, (level, limit)).fetchall()
+    
+    def level_summary(self):
+        """level -> (runs, wins, accuracy, best caught) over the whole history"""
+        rows = self.db.execute("SELECT level, runs, wins, caught, total, best FROM level_stats")
+        return {level: (runs, wins, caught / total if total else 0.0, best)
+                for level, runs, wins, caught, total, best in rows}
+    
+    def close(self):
+        """Write queued runs and stop the writer thread"""
+        with self.lock:
+            self.closed = True
+            self.lock.notify()
+        self.writer.join()
+        self.db.close()
\ No newline at end of file
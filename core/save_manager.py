@@ -1,43 +1,143 @@
 import json
 import os
+import threading
+import time
 from config import Config
 
 
 class SaveManager:
+    """Player progress, written to disk behind the game by a background thread
     
-    def __init__(self):
-        self.data = {"unlocked_level": 1}
+    Changes only mark the data dirty; the writer coalesces marks that arrive
+    within Config.SAVE_COALESCE_MS and replaces the file atomically (temp file,
+    fsync, rename), so a crash leaves either the previous save or the new one.
+    """
+    
+    VERSION = 2
+    
+    def __init__(self, path=None):
+        self.path = path or Config.SAVE_FILE
+        self.data = self._defaults()
+        
+        # Guards self.data and the writer state below
+        self.lock = threading.Condition()
+        self.dirty = False
+        self.closed = False
+        self.writes = 0
+        
         self._ensure_data_dir()
         self.load()
+        self.writer = threading.Thread(target=self._write_loop, name="save-writer", daemon=True)
+        self.writer.start()
+    
+    def _defaults(self):
+        # levels: str(level) -> clears, best_score, best_accuracy, best_time_ms
+        return {"version": self.VERSION, "unlocked_level": 1, "levels": {}}
     
     def _ensure_data_dir(self):
-        data_dir = os.path.dirname(Config.SAVE_FILE)
+        data_dir = os.path.dirname(self.path)
         if data_dir and not os.path.exists(data_dir):
             os.makedirs(data_dir)
     
+    def _migrate(self, data):
+        """Bring a loaded save up to the current schema version"""
+        version = data.get("version", 1)
+        if version > self.VERSION:
+            print(f"Warning: save file is from a newer version ({version})")
+        
+        if version == 1:
+            # v1 stored only the unlocked level
+            data = {"version": 2, "unlocked_level": data.get("unlocked_level", 1), "levels": {}}
+            version = 2
+        
+        data["version"] = max(version, self.VERSION)
+        data.setdefault("unlocked_level", 1)
+        data.setdefault("levels", {})
+        return data
+    
     def save(self):
+        """Queue a write of the current data; returns immediately"""
+        with self.lock:
+            self._mark_dirty()
+    
+    def _mark_dirty(self):
+        # Caller holds the lock
+        self.dirty = True
+        self.lock.notify()
+    
+    def _write_loop(self):
+        while True:
+            with self.lock:
+                while not self.dirty and not self.closed:
+                    self.lock.wait()
+                if not self.dirty:
+                    return
+                closing = self.closed
+            
+            # Let a burst of changes (unlock + level record) land in one write
+            if not closing:
+                time.sleep(Config.SAVE_COALESCE_MS / 1000)
+            
+            with self.lock:
+                text = json.dumps(self.data, indent=2)
+                self.dirty = False
+            self._write(text)
+    
+    def _write(self, text):
+        tmp = self.path + ".tmp"
         try:
-            with open(Config.SAVE_FILE, 'w') as f:
-                json.dump(self.data, f, indent=2)
-        except Exception as e:
+            with open(tmp, 'w') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+            self.writes += 1
+        except OSError as e:
             print(f"Error saving game: {e}")
     
+    def close(self):
+        """Write anything pending and stop the writer thread"""
+        with self.lock:
+            self.closed = True
+            self.lock.notify()
+        self.writer.join()
+    
     def load(self):
-        if os.path.exists(Config.SAVE_FILE):
+        if os.path.exists(self.path):
             try:
-                with open(Config.SAVE_FILE, 'r') as f:
-                    self.data = json.load(f)
+                with open(self.path, 'r') as f:
+                    self.data = self._migrate(json.load(f))
             except Exception as e:
                 print(f"Error loading save file: {e}")
     
     def unlock_level(self, level):
-        if level > self.data["unlocked_level"]:
-            self.data["unlocked_level"] = level
-            self.save()
+        with self.lock:
+            if level > self.data["unlocked_level"]:
+                self.data["unlocked_level"] = level
+                self._mark_dirty()
+    
+    def record_clear(self, level, caught, total, time_ms):
+        """Count a cleared level and keep its best score, accuracy and time"""
+        accuracy = caught / total if total else 1.0
+        with self.lock:
+            record = self.data["levels"].setdefault(str(level), {
+                "clears": 0, "best_score": 0, "best_accuracy": 0.0, "best_time_ms": None
+            })
+            record["clears"] += 1
+            record["best_score"] = max(record["best_score"], caught)
+            record["best_accuracy"] = max(record["best_accuracy"], accuracy)
+            if record["best_time_ms"] is None or time_ms < record["best_time_ms"]:
+                record["best_time_ms"] = time_ms
+            self._mark_dirty()
+    
+    def get_level_record(self, level):
+        """Per-level bests, or None if the level was never cleared"""
+        return self.data["levels"].get(str(level))
     
     def get_unlocked_level(self):
         return self.data["unlocked_level"]
     
     def reset_progress(self):
-        self.data = {"unlocked_level": 1}
-        self.save()
\ No newline at end of file
+        with self.lock:
+            self.data = self._defaults()
+            self._mark_dirty()
\ No newline at end of file
@@ -1,4 +1,18 @@
-from .player import Player
-from .trash import Trash
+import importlib
 
-__all__ = ['Player', 'Trash']
\ No newline at end of file
+# Public name -> submodule defining it. Submodules load on first access, so
+# importing the package itself needs neither pygame nor Cairo
+_EXPORTS = {
+    'ParticleSystem': 'particles',
+    'Player': 'player',
+    'TrashStore': 'trash',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
\ No newline at end of file
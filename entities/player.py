@@ -1,6 +1,6 @@
 import pygame
 from config import Config, TrashType
-from core.asset_factory import AssetFactory
+from core.asset_factory import AssetFactory, asset_registry
 
 
 class Player(pygame.sprite.Sprite):
@@ -8,35 +8,52 @@ class Player(pygame.sprite.Sprite):
     def __init__(self):
         super().__init__()
         
-        # Load both bin sprites
-        self.img_organic = AssetFactory.create_bin_sprite(Config.GREEN)
-        self.img_inorganic = AssetFactory.create_bin_sprite(Config.BLUE)
+        # Load both bin sprites (shared across sessions), sized for the world canvas
+        self.scale = AssetFactory.world_scale(AssetFactory.BIN_SCALE)
+        self.img_organic = asset_registry.acquire(AssetFactory.create_bin_sprite, Config.GREEN, scale=self.scale)
+        self.img_inorganic = asset_registry.acquire(AssetFactory.create_bin_sprite, Config.BLUE, scale=self.scale)
         
-        # Set initial state
+        # Set initial state; the rect stays in screen units whatever the sprite size
         self.current_type = TrashType.ORGANIC
         self.image = self.img_organic
-        self.rect = self.image.get_rect()
-        self.rect.midbottom = (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 20)
+        self.rect = pygame.Rect(0, 0, Config.BIN_SIZE, Config.BIN_SIZE)
+        self.rect.midbottom = (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - Config.BIN_FLOOR_GAP)
+        
+        # Sub-pixel position; previous step kept for render interpolation
+        self.float_x = float(self.rect.x)
+        self.prev_x = self.float_x
         
         # Stats
         self.health = 3
-        self.last_swap_time = 0
+        self.next_swap_time = 0
     
-    def update(self, keys, dt):
-        """Update player position based on input"""
+    @staticmethod
+    def read_move(keys):
+        """Horizontal input from held keys: -1 left, 1 right, 0 none or both"""
+        move = 0
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.rect.x -= Config.PLAYER_SPEED
+            move -= 1
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.rect.x += Config.PLAYER_SPEED
+            move += 1
+        return move
+    
+    def update(self, move, dt):
+        """Update player position for a move direction (dt in sim milliseconds)"""
+        self.prev_x = self.float_x
+        self.float_x += move * Config.PLAYER_SPEED * dt / Config.SPEED_REF_MS
         
         # Keep player on screen
-        self.rect.left = max(0, self.rect.left)
-        self.rect.right = min(Config.SCREEN_WIDTH, self.rect.right)
+        self.float_x = max(0.0, min(Config.SCREEN_WIDTH - self.rect.width, self.float_x))
+        self.rect.x = int(self.float_x)
     
-    def swap_bin(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_swap_time > Config.SWAP_COOLDOWN:
-            self.last_swap_time = now
+    def render_pos(self, alpha):
+        """Position between last two sim steps"""
+        return (int(self.prev_x + (self.float_x - self.prev_x) * alpha), self.rect.y)
+    
+    def swap_bin(self, now):
+        """Toggle bin type if the cooldown (in sim milliseconds) has passed"""
+        if now >= self.next_swap_time:
+            self.next_swap_time = now + Config.SWAP_COOLDOWN
             
             if self.current_type == TrashType.ORGANIC:
                 self.current_type = TrashType.INORGANIC
@@ -61,4 +78,12 @@ class Player(pygame.sprite.Sprite):
         self.health = 3
         self.current_type = TrashType.ORGANIC
         self.image = self.img_organic
-        self.rect.midbottom = (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 20)
\ No newline at end of file
+        self.rect.midbottom = (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - Config.BIN_FLOOR_GAP)
+        self.float_x = float(self.rect.x)
+        self.prev_x = self.float_x
+        self.next_swap_time = 0
+    
+    def release_assets(self):
+        """Return bin sprites to the shared registry"""
+        asset_registry.release(AssetFactory.create_bin_sprite, Config.GREEN, scale=self.scale)
+        asset_registry.release(AssetFactory.create_bin_sprite, Config.BLUE, scale=self.scale)
\ No newline at end of file
@@ -1,33 +1,167 @@
-import pygame
 import random
+import numpy as np
 from config import Config, TrashType
-from core.asset_factory import AssetFactory
+from core.asset_factory import AssetFactory, asset_registry
 
 
-class Trash(pygame.sprite.Sprite):
+class TrashStore:
+    """Falling trash kept as NumPy columns, updated and drawn in bulk
     
-    def __init__(self, t_type: TrashType, speed: float):
-        super().__init__()
-        
-        self.type = t_type
+    Live items occupy rows [0, count) so every bulk operation works on one
+    contiguous slice; removal compacts the columns.
+    """
+    
+    VARIANTS = 3
+    TYPES = {t.value: t for t in TrashType}
+    COLUMNS = (("x", np.int32), ("y", np.float64), ("prev_y", np.float64),
+               ("speed", np.float64), ("type", np.int8), ("variant", np.int8))
+    
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.capacity = 0
+        self._resize(capacity)
         
+        # Sprite per (type code * VARIANTS + variant), acquired on first use
+        self.sprites = [None] * ((max(t.value for t in TrashType) + 1) * self.VARIANTS)
+        self.sprite_keys = []
+        self.scale = AssetFactory.world_scale(AssetFactory.TRASH_SCALE)
+    
+    def _resize(self, capacity):
+        for name, dtype in self.COLUMNS:
+            col = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                col[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, col)
+        self.capacity = capacity
+    
+    def __len__(self):
+        return self.count
+    
+    def __bool__(self):
+        return self.count > 0
+    
+    def spawn(self, t_type: TrashType, speed: float, rng=random):
+        """Add one item at the top of the screen with a random look and column"""
         # Pick random visual variant (0, 1, or 2)
-        variant = random.randint(0, 2)
-        self.image = AssetFactory.create_trash_sprite(t_type, variant)
+        variant = rng.randint(0, 2)
+        if t_type == TrashType.BONUS:
+            variant = 0  # Star has a single look
+        x = rng.randint(50, Config.SCREEN_WIDTH - 50)
+        self.add(t_type.value, variant, x, -50.0, speed)
+    
+    def add(self, type_code, variant, x, y, speed):
+        if self.count == self.capacity:
+            self._resize(self.capacity * 2)
+        
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.prev_y[i] = y
+        self.speed[i] = speed
+        self.type[i] = type_code
+        self.variant[i] = variant
+        self.count += 1
+        self._get_sprite(type_code, variant)
+    
+    def add_many(self, type_codes, variants, xs, speeds):
+        """Add a batch of items at the top of the screen (array arguments)"""
+        k = len(type_codes)
+        if self.count + k > self.capacity:
+            self._resize(max(self.capacity * 2, self.count + k))
+        
+        rows = slice(self.count, self.count + k)
+        self.x[rows] = xs
+        self.y[rows] = -50.0
+        self.prev_y[rows] = -50.0
+        self.speed[rows] = speeds
+        self.type[rows] = type_codes
+        self.variant[rows] = variants
+        self.count += k
+        
+        for type_code, variant in zip(type_codes.tolist(), variants.tolist()):
+            if self.sprites[type_code * self.VARIANTS + variant] is None:
+                self._get_sprite(type_code, variant)
+    
+    def prefetch(self, keys):
+        """Acquire sprites for (TrashType, variant) looks before they spawn"""
+        for t_type, variant in keys:
+            self._get_sprite(t_type.value, variant)
+    
+    def _get_sprite(self, type_code, variant):
+        idx = type_code * self.VARIANTS + variant
+        sprite = self.sprites[idx]
+        if sprite is None:
+            key = (TrashType(type_code), variant)
+            sprite = asset_registry.acquire(AssetFactory.create_trash_sprite, *key, scale=self.scale)
+            self.sprites[idx] = sprite
+            self.sprite_keys.append(key)
+        return sprite
+    
+    def update(self, dt):
+        """Move every item downward (dt in sim milliseconds)"""
+        n = self.count
+        self.prev_y[:n] = self.y[:n]
+        self.y[:n] += self.speed[:n] * (dt / Config.SPEED_REF_MS)
+    
+    def tops(self):
+        """Integer rect tops of live items (truncated like pygame.Rect)"""
+        return np.trunc(self.y[:self.count])
+    
+    def overlapping(self, rect):
+        """Indices of items whose rect overlaps the given rect"""
+        n = self.count
+        size = Config.TRASH_SIZE
+        x = self.x[:n]
+        top = self.tops()
+        hit = ((x < rect.right) & (rect.left < x + size)
+               & (top < rect.bottom) & (rect.top < top + size))
+        return np.flatnonzero(hit)
+    
+    def offscreen(self):
+        """Indices of items that fell below the screen"""
+        return np.flatnonzero(self.tops() > Config.SCREEN_HEIGHT)
+    
+    def get_type(self, i):
+        return self.TYPES[int(self.type[i])]
+    
+    def remove(self, indices):
+        """Remove items by index, keeping the rest in spawn (draw) order"""
+        n = self.count
+        keep = np.ones(n, dtype=bool)
+        keep[indices] = False
+        kept = int(keep.sum())
+        for name, _ in self.COLUMNS:
+            col = getattr(self, name)
+            col[:kept] = col[:n][keep]
+        self.count = kept
+    
+    def clear(self):
+        self.count = 0
+    
+    def draw(self, surface, alpha=0.0, canvas_scale=1):
+        """Blit every item in one batched call; returns the covered rects
+        
+        canvas_scale divides positions when drawing on the low-res world canvas.
+        """
+        n = self.count
+        if n == 0:
+            return []
         
-        self.rect = self.image.get_rect()
-        self.rect.x = random.randint(50, Config.SCREEN_WIDTH - 50)
-        self.rect.y = -50
+        # Interpolate between the last two sim steps
+        ys = (self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha).astype(np.int32)
+        xs = self.x[:n]
+        if canvas_scale > 1:
+            xs = xs // canvas_scale
+            ys //= canvas_scale
+        idx = (self.type[:n].astype(np.int32) * self.VARIANTS + self.variant[:n]).tolist()
         
-        # Use float for smooth movement
-        self.float_y = float(self.rect.y)
-        self.speed = speed
-    
-    def update(self):
-        """Move trash downward"""
-        self.float_y += self.speed
-        self.rect.y = int(self.float_y)
-    
-    def is_offscreen(self):
-        """Check if trash has fallen off screen"""
-        return self.rect.top > Config.SCREEN_HEIGHT
\ No newline at end of file
+        # Stream pairs so each one is freed (and reused by zip) right after its blit
+        images = map(self.sprites.__getitem__, idx)
+        return surface.blits(zip(images, zip(xs.tolist(), ys.tolist())))
+    
+    def release_assets(self):
+        """Return trash sprites to the shared registry"""
+        for key in self.sprite_keys:
+            asset_registry.release(AssetFactory.create_trash_sprite, *key, scale=self.scale)
+        self.sprite_keys = []
+        self.sprites = [None] * len(self.sprites)
\ No newline at end of file
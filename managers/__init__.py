@@ -1,5 +1,22 @@
-from .level_manager import LevelManager
-from .spawner import Spawner
-from .ui_manager import UIManager, UIElement, Cursor
+import importlib
 
-__all__ = ['LevelManager', 'Spawner', 'UIManager', 'UIElement', 'Cursor']
+# Public name -> submodule defining it. Submodules load on first access, so
+# the level and spawn rules load without the UI (pygame and Cairo)
+_EXPORTS = {
+    'CollisionManager': 'collision_manager',
+    'LevelManager': 'level_manager',
+    'Spawner': 'spawner',
+    'UIManager': 'ui_manager',
+    'UIElement': 'ui_manager',
+    'Cursor': 'ui_manager',
+    'GlyphAtlas': 'ui_manager',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
\ No newline at end of file
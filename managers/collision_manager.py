@@ -0,0 +1,22 @@
+import numpy as np
+
+
+class CollisionManager:
+    """Collision between bins and falling trash
+    
+    Each bin tests every live item in one vectorized pass. With the handful of
+    bins the game has this beats a sorted sweep, whose bookkeeping costs more
+    than the scans it saves.
+    """
+    
+    def pairs(self, store, bins):
+        """Overlapping (bin index, item index) arrays, at most one bin per item"""
+        owner = np.full(store.count, -1)
+        
+        # Scan bins last to first so an item touching two goes to the first
+        for b in reversed(range(len(bins))):
+            owner[store.overlapping(bins[b].rect)] = b
+        
+        # Results in spawn order
+        item = np.flatnonzero(owner >= 0)
+        return owner[item], item
\ No newline at end of file
@@ -3,6 +3,14 @@ from config import Config
 
 class LevelManager:
     
+    STORM_LEVEL = 11
+    ENDLESS_LEVEL = 12
+    
+    # Endless mode: segments keep ramping past level 10 up to these limits
+    SEGMENT_TRASH = 30
+    ENDLESS_MIN_INTERVAL = 300
+    ENDLESS_MAX_SPEED = Config.BASE_TRASH_SPEED * 2
+    
     def __init__(self):
         self.levels = {}
         self._generate_levels()
@@ -14,9 +22,31 @@ class LevelManager:
                 "total_trash": 10 + (i * 5),
                 "spawn_interval": max(550, 2300 - (i * 130))
             }
+        
+        # Endless: streamed segment by segment, this is only the first one
+        self.levels[self.ENDLESS_LEVEL] = self.endless_segment(0)
+        
+        # Trash storm: thousands of slow items at once, no damage, score only
+        self.levels[self.STORM_LEVEL] = {
+            "speed": Config.BASE_TRASH_SPEED * 0.6,
+            "total_trash": 6000,
+            "spawn_interval": 40,
+            "burst": 40,
+            "damage": False
+        }
     
     def get_level_data(self, level_num):
         return self.levels.get(level_num, self.levels[1])
     
     def get_total_levels(self):
-        return len(self.levels)
\ No newline at end of file
+        return len(self.levels)
+    
+    def endless_segment(self, index):
+        """Level data for the index-th endless segment, continuing the level ramp"""
+        i = 11 + index
+        return {
+            "speed": min(Config.BASE_TRASH_SPEED + (i * 0.25), self.ENDLESS_MAX_SPEED),
+            "total_trash": self.SEGMENT_TRASH,
+            "spawn_interval": max(self.ENDLESS_MIN_INTERVAL, 2300 - (i * 130)),
+            "endless": True
+        }
\ No newline at end of file
@@ -1,47 +1,134 @@
 import random
-from config import TrashType
-from entities.trash import Trash
+import numpy as np
+from config import Config, TrashType
 
 
 class Spawner:
+    """Plays back a level's spawn schedule, compiled up front from a seed
 
-    def __init__(self, level_data):
-        self.speed = level_data['speed']
+    Every item's sim time, type, look, column and speed is decided when the
+    spawner is built, so the level can be inspected (summary) and its sprites
+    prefetched before play; update() only advances a cursor.
+    
+    With `segments` (index -> level data) the level never finishes: when the
+    cursor reaches the end, the next segment is compiled in place of the last,
+    so memory stays flat however long the session runs.
+    """
+    
+    # Spawn odds: 5% bonus, 47.5% organic, 47.5% inorganic
+    BONUS_CHANCE = 0.05
+    ORGANIC_CHANCE = 0.525
+    
+    def __init__(self, level_data, rng=None, step_ms=1000.0 / Config.SIM_HZ, segments=None):
+        # Seeded generator makes a session reproducible (replays)
+        self.rng = rng or random.Random()
+        self.step_ms = step_ms
+        self.segments = segments
+        self.segment = 0
+        
+        self._compile(level_data, 0.0)
+        self.finished = self.total == 0 and segments is None
+    
+    def _compile(self, level_data, start):
+        """Build the schedule columns: time (sim ms), type, variant, x, speed"""
+        self.base_speed = level_data['speed']
         self.total = level_data['total_trash']
         self.interval = level_data['spawn_interval']
-        
+        self.burst = level_data.get('burst', 1)
         self.count = 0
-        self.last_spawn_time = 0
-        self.finished = False
-    
-    def update(self, current_time, group):
-        """Update spawner and create new trash if needed"""
-        if self.finished:
-            return
         
-        if current_time - self.last_spawn_time > self.interval:
-            self._spawn(group)
-            self.last_spawn_time = current_time
-            
-            if self.count >= self.total:
-                self.finished = True
-    
-    def _spawn(self, group):
-        self.count += 1
+        n = self.total
+        self.time = np.zeros(n)
+        self.type = np.zeros(n, dtype=np.int8)
+        self.variant = np.zeros(n, dtype=np.int8)
+        self.x = np.zeros(n, dtype=np.int32)
+        self.speed = np.zeros(n)
+        
+        now = start
+        for i in range(n):
+            if i and i % self.burst == 0:
+                now = self._next_burst(now)
+            self.time[i] = now
+            self._roll(i)
         
-        # Determine trash type (5% bonus, 47.5% organic, 47.5% inorganic)
-        roll = random.random()
-        if roll < 0.05:
+        # Where a following segment picks up
+        self.resume = self._next_burst(now)
+    
+    def _next_burst(self, now):
+        # Bursts land on the first fixed step at or after the previous one plus
+        # the interval; summing steps like GameClock keeps times bit-identical
+        due = now + self.interval
+        while now < due:
+            now += self.step_ms
+        return now
+    
+    def _roll(self, i):
+        # Draw order (type, speed, variant, x) is part of the replay format
+        roll = self.rng.random()
+        if roll < self.BONUS_CHANCE:
             t_type = TrashType.BONUS
-        elif roll < 0.525:
+        elif roll < self.ORGANIC_CHANCE:
             t_type = TrashType.ORGANIC
         else:
             t_type = TrashType.INORGANIC
         
         # Add speed variation
-        speed_variation = random.uniform(0.9, 1.1)
-        trash = Trash(t_type, self.speed * speed_variation)
-        group.add(trash)
+        self.speed[i] = self.base_speed * self.rng.uniform(0.9, 1.1)
+        
+        # Pick random visual variant (0, 1, or 2); the star has a single look
+        variant = self.rng.randint(0, 2)
+        self.variant[i] = 0 if t_type == TrashType.BONUS else variant
+        self.x[i] = self.rng.randint(50, Config.SCREEN_WIDTH - 50)
+        self.type[i] = t_type.value
+    
+    def update(self, current_time, store):
+        """Spawn every scheduled item due by current_time (sim milliseconds)"""
+        if self.finished:
+            return
+        
+        end = int(np.searchsorted(self.time, current_time, side="right"))
+        if end > self.count:
+            due = slice(self.count, end)
+            store.add_many(self.type[due], self.variant[due], self.x[due], self.speed[due])
+            self.count = end
+        
+        if self.count >= self.total:
+            if self.segments is None:
+                self.finished = True
+            else:
+                self.segment += 1
+                self._compile(self.segments(self.segment), self.resume)
+    
+    def sprite_keys(self):
+        """Distinct (TrashType, variant) looks the level will spawn"""
+        # Imported here: the store draws with Cairo assets, the schedule does not
+        from entities.trash import TrashStore
+        codes = np.unique(self.type.astype(np.int32) * TrashStore.VARIANTS + self.variant)
+        return [(TrashType(code // TrashStore.VARIANTS), code % TrashStore.VARIANTS)
+                for code in codes.tolist()]
+    
+    def summary(self):
+        """Difficulty figures for the whole schedule, computed without playing
+        
+        An item is counted on screen from its spawn until it falls past the
+        bottom edge uncaught, so peak_on_screen is the worst case to sort.
+        """
+        if self.total == 0:
+            return {"items": 0, "bonus": 0, "duration_s": 0.0, "items_per_s": 0.0,
+                    "peak_on_screen": 0, "mean_speed": 0.0}
+        
+        fall_ms = (Config.SCREEN_HEIGHT + 50) / self.speed * Config.SPEED_REF_MS
+        gone = np.sort(self.time + fall_ms)
+        on_screen = np.arange(1, self.total + 1) - np.searchsorted(gone, self.time, side="right")
+        duration = float(gone[-1]) / 1000
+        return {
+            "items": self.total,
+            "bonus": int(np.count_nonzero(self.type == TrashType.BONUS.value)),
+            "duration_s": duration,
+            "items_per_s": self.total / duration,
+            "peak_on_screen": int(on_screen.max()),
+            "mean_speed": float(self.speed.mean())
+        }
     
     def is_finished(self):
         """Check if all trash has been spawned"""
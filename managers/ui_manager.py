@@ -1,7 +1,7 @@
 import pygame
-import cairo
+from collections import OrderedDict
 from config import Config, TrashType
-from core.asset_factory import AssetFactory
+from core.asset_factory import AssetFactory, asset_registry
 
 
 class UIElement:
@@ -13,54 +13,9 @@ class UIElement:
         self.hovered = False
         self.color_theme = color_theme
         
-        # Pre-generate surfaces for performance
-        self.surf_normal = self._gen_surf(hover=False)
-        self.surf_hover = self._gen_surf(hover=True)
-    
-    def _gen_surf(self, hover=False):
-        """Generate button surface with 3D effect"""
-        depth = 6
-        s = cairo.ImageSurface(cairo.FORMAT_ARGB32, self.rect.width, self.rect.height + depth)
-        ctx = cairo.Context(s)
-        
-        w, h = self.rect.width, self.rect.height
-        r, g, b = [c/255.0 for c in self.color_theme]
-        
-        # Adjust brightness for hover/shadow
-        shadow_r, shadow_g, shadow_b = r * 0.6, g * 0.6, b * 0.6
-        if hover:
-            r, g, b = min(1, r*1.2), min(1, g*1.2), min(1, b*1.2)
-        
-        # Black outline
-        ctx.set_source_rgba(0, 0, 0, 1)
-        self._rounded_rect(ctx, 0, depth, w, h, 8)
-        self._rounded_rect(ctx, 0, 0, w, h, 8)
-        ctx.fill()
-        
-        # Shadow (darker bottom)
-        ctx.set_source_rgba(shadow_r, shadow_g, shadow_b, 1)
-        self._rounded_rect(ctx, 2, 2 + depth - 2, w-4, h-4, 6)
-        ctx.fill()
-        
-        # Main face
-        ctx.set_source_rgba(r, g, b, 1)
-        self._rounded_rect(ctx, 2, 2, w-4, h-6, 6)
-        ctx.fill()
-        
-        return AssetFactory.cairo_to_pygame(s, 1)
-    
-    def _rounded_rect(self, ctx, x, y, w, h, r):
-        """Draw rounded rectangle path"""
-        ctx.move_to(x+r, y)
-        ctx.line_to(x+w-r, y)
-        ctx.curve_to(x+w, y, x+w, y, x+w, y+r)
-        ctx.line_to(x+w, y+h-r)
-        ctx.curve_to(x+w, y+h, x+w, y+h, x+w-r, y+h)
-        ctx.line_to(x+r, y+h)
-        ctx.curve_to(x, y+h, x, y+h, x, y+h-r)
-        ctx.line_to(x, y+r)
-        ctx.curve_to(x, y, x, y, x+r, y)
-        ctx.close_path()
+        # Buttons with the same size and theme share surfaces
+        self.surf_normal = asset_registry.acquire(AssetFactory.create_button_sprite, w, h, color_theme, False)
+        self.surf_hover = asset_registry.acquire(AssetFactory.create_button_sprite, w, h, color_theme, True)
     
     def draw(self, screen, ui_manager):
         """Render button to screen"""
@@ -83,25 +38,76 @@ class Cursor(pygame.sprite.Sprite):
     
     def __init__(self):
         super().__init__()
-        self.image = AssetFactory.create_cursor()
+        self.image = asset_registry.acquire(AssetFactory.create_cursor)
         self.rect = self.image.get_rect()
     
-    def update(self):
-        """Update cursor position"""
-        self.rect.topleft = pygame.mouse.get_pos()
+    def update(self, pos):
+        """Update cursor position (logical screen coordinates)"""
+        self.rect.topleft = pos
     
     def draw(self, screen):
-        """Draw cursor if mouse is focused"""
+        """Draw cursor if mouse is focused, returns drawn rect"""
         if pygame.mouse.get_focused():
-            screen.blit(self.image, self.rect)
+            return screen.blit(self.image, self.rect)
+        return None
+
+
+class GlyphAtlas:
+    """Pre-rendered outlined glyphs for strings that change every few frames"""
+    
+    def __init__(self, ui_manager, size, color, outline=True):
+        self.ui = ui_manager
+        self.size = size
+        self.color = color
+        self.outline = outline
+        self.font = ui_manager.get_font(size)
+        
+        # char -> (surface, advance)
+        self.glyphs = {}
+    
+    def get_glyph(self, char):
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            surf = self.ui.bake_text(char, self.size, self.color, self.outline)
+            glyph = (surf, self.font.size(char)[0])
+            self.glyphs[char] = glyph
+        return glyph
+    
+    def draw(self, surface, text, x, y):
+        """Compose text from cached glyphs (top-left anchored), returns covered rect"""
+        pad = UIManager.OUTLINE_PAD if self.outline else 0
+        pen_x = x - pad
+        pen_y = y - pad
+        seq = []
+        for char in text:
+            glyph, advance = self.get_glyph(char)
+            seq.append((glyph, (pen_x, pen_y)))
+            pen_x += advance
+        if not seq:
+            return pygame.Rect(x, y, 0, 0)
+        rects = surface.blits(seq)
+        return rects[0].unionall(rects[1:])
 
 
 class UIManager:
     
+    OUTLINE_PAD = 2
+    OUTLINE_OFFSETS = [(-2, -2), (-2, 2), (2, -2), (2, 2), 
+                       (-2, 0), (2, 0), (0, -2), (0, 2)]
+    
     def __init__(self):
         pygame.font.init()
         self.fonts = {}
-        self.heart_icon = AssetFactory.create_heart_sprite()
+        
+        # Baked text surfaces, least recently used first
+        self.text_cache = OrderedDict()
+        self.atlases = {}
+        
+        # Retained screens: name -> [signature, surface]
+        self.screens = {}
+        self.shades = {}
+        # Acquired on first HUD draw, once the bake pipeline has delivered it
+        self.heart_icon = None
     
     def get_font(self, size):
         """Get or create font of specified size"""
@@ -114,40 +120,99 @@ class UIManager:
                 self.fonts[size] = pygame.font.SysFont("Arial", size, bold=True)
         return self.fonts[size]
     
-    def draw_text(self, surface, text, size, x, y, color=Config.WHITE, center=False, outline=True):
-        """Draw text with optional outline"""
+    def bake_text(self, text, size, color, outline=True):
+        """Render text and its outline into a single surface"""
         f = self.get_font(size)
+        fill = f.render(text, False, color)
+        if not outline:
+            return AssetFactory.finalize(fill)
         
-        def render_at(txt, col, pos_x, pos_y):
-            surf = f.render(txt, False, col)
-            rect = surf.get_rect()
-            if center:
-                rect.center = (pos_x, pos_y)
-            else:
-                rect.topleft = (pos_x, pos_y)
-            surface.blit(surf, rect)
+        pad = self.OUTLINE_PAD
+        w, h = fill.get_size()
+        surf = pygame.Surface((w + pad * 2, h + pad * 2), pygame.SRCALPHA)
+        shadow = f.render(text, False, Config.BLACK)
+        for ox, oy in self.OUTLINE_OFFSETS:
+            surf.blit(shadow, (pad + ox, pad + oy))
+        surf.blit(fill, (pad, pad))
+        return AssetFactory.finalize(surf)
+    
+    def render_text(self, text, size, color=Config.WHITE, outline=True):
+        """Get baked text surface from the LRU cache"""
+        key = (text, size, color, outline)
+        surf = self.text_cache.get(key)
+        if surf is not None:
+            self.text_cache.move_to_end(key)
+            return surf
         
-        # Draw outline
-        if outline:
-            offsets = [(-2, -2), (-2, 2), (2, -2), (2, 2), 
-                      (-2, 0), (2, 0), (0, -2), (0, 2)]
-            for ox, oy in offsets:
-                render_at(text, Config.BLACK, x + ox, y + oy)
+        surf = self.bake_text(text, size, color, outline)
+        self.text_cache[key] = surf
+        if len(self.text_cache) > Config.TEXT_CACHE_SIZE:
+            self.text_cache.popitem(last=False)
+        return surf
+    
+    def get_atlas(self, size, color=Config.WHITE, outline=True):
+        """Get or create glyph atlas for a text style"""
+        key = (size, color, outline)
+        if key not in self.atlases:
+            self.atlases[key] = GlyphAtlas(self, size, color, outline)
+        return self.atlases[key]
+    
+    def draw_text(self, surface, text, size, x, y, color=Config.WHITE, center=False, outline=True):
+        """Draw text with optional outline"""
+        surf = self.render_text(text, size, color, outline)
+        rect = surf.get_rect()
+        if center:
+            rect.center = (x, y)
+        else:
+            pad = self.OUTLINE_PAD if outline else 0
+            rect.topleft = (x - pad, y - pad)
+        return surface.blit(surf, rect)
+    
+    def draw_glyphs(self, surface, text, size, x, y, color=Config.WHITE, outline=True):
+        """Draw fast-changing text from the glyph atlas (top-left anchored)"""
+        return self.get_atlas(size, color, outline).draw(surface, text, x, y)
+    
+    def get_shade(self, size, alpha):
+        """Get a reusable translucent black overlay"""
+        key = (size, alpha)
+        if key not in self.shades:
+            shade = pygame.Surface(size, pygame.SRCALPHA)
+            shade.fill((0, 0, 0, alpha))
+            self.shades[key] = shade
+        return self.shades[key]
+    
+    def draw_composed(self, surface, name, signature, render):
+        """Blit a retained screen, re-rendering it only when its signature changes"""
+        entry = self.screens.get(name)
+        if entry is None:
+            entry = [None, pygame.Surface(surface.get_size())]
+            self.screens[name] = entry
+        
+        if entry[0] is None or entry[0] != signature:
+            render(entry[1])
+            entry[0] = signature
         
-        # Draw main text
-        render_at(text, color, x, y)
+        surface.blit(entry[1], (0, 0))
+    
+    def invalidate_screens(self):
+        """Force every retained screen to re-render on next draw"""
+        for entry in self.screens.values():
+            entry[0] = None
     
     def draw_hud(self, surface, player, stats, level):
-        """Draw heads-up display during gameplay"""
+        """Draw heads-up display during gameplay, returns touched rects"""
         # Heart icon + HP
-        surface.blit(self.heart_icon, (20, 20))
-        self.draw_text(surface, f"x {player.health}", 25, 60, 22, Config.RED)
+        if self.heart_icon is None:
+            self.heart_icon = asset_registry.acquire(AssetFactory.create_heart_sprite)
+        rects = [surface.blit(self.heart_icon, (20, 20))]
+        rects.append(self.draw_glyphs(surface, f"x {player.health}", 25, 60, 22, Config.RED))
         
         # Level and score
-        self.draw_text(surface, f"Level: {level}", 15, 20, 60)
-        self.draw_text(surface, f"Score: {stats['caught']}/{stats['total']}", 15, 20, 85)
+        rects.append(self.draw_text(surface, f"Level: {level}", 15, 20, 60))
+        rects.append(self.draw_glyphs(surface, f"Score: {stats['caught']}/{stats['total']}", 15, 20, 85))
         
         # Bin type indicator
         ind_col = Config.GREEN if player.current_type == TrashType.ORGANIC else Config.BLUE
-        self.draw_text(surface, f"BIN: {player.current_type.name}", 23, 
-                      Config.SCREEN_WIDTH - 350, 60, ind_col)
\ No newline at end of file
+        rects.append(self.draw_text(surface, f"BIN: {player.current_type.name}", 23, 
+                                    Config.SCREEN_WIDTH - 350, 60, ind_col))
+        return rects
\ No newline at end of file
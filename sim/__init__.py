@@ -0,0 +1,3 @@
+from .vector_env import BinSortVecEnv
+
+__all__ = ['BinSortVecEnv']
\ No newline at end of file
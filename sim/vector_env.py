@@ -0,0 +1,190 @@
+"""
+Vectorized headless environment
+Steps many independent BinSort games in lockstep with NumPy (no display, no Cairo)
+"""
+import random
+import numpy as np
+from config import Config, TrashType
+from managers.level_manager import LevelManager
+from managers.spawner import Spawner
+
+
+class BinSortVecEnv:
+    """Gym-style batch of BinSort games following GameManager.update_gameplay rules
+    
+    Actions per game: 0 stay, 1 left, 2 right, +3 to also swap the bin (3, 4, 5).
+    Rewards: +1 per correctly sorted item, -1 per failed one (damage, unless
+    the level is score only). Finished games are reset automatically; step()
+    reports them in `dones`.
+    
+    Endless levels raise ValueError: the game streams segments forever, while
+    every game here ends after a fixed total.
+    
+    max_items defaults to the level's peak on screen, so nothing is dropped; an
+    item that finds its game full waits for a free slot instead of being lost.
+    """
+    
+    EMPTY = 0
+    MOVE = np.array([0, -1, 1, 0, -1, 1], dtype=np.float32)
+    SWAP = np.array([False, False, False, True, True, True])
+    
+    # Spawn odds, same as Spawner
+    BONUS_CHANCE = Spawner.BONUS_CHANCE
+    ORGANIC_CHANCE = Spawner.ORGANIC_CHANCE
+    
+    def __init__(self, num_envs, level=1, max_items=None):
+        self.num_envs = num_envs
+        self.level = level
+        
+        data = LevelManager().get_level_data(level)
+        if data.get("endless"):
+            raise ValueError(f"level {level} is endless and cannot be modelled by BinSortVecEnv")
+        self.speed = data["speed"]
+        self.total = data["total_trash"]
+        self.interval = data["spawn_interval"]
+        self.burst = data.get("burst", 1)
+        self.damage = data.get("damage", True)
+        if max_items is None:
+            # Worst case of any seed is close to this one's; a burst of headroom
+            peak = Spawner(data, random.Random(0)).summary()["peak_on_screen"]
+            max_items = peak + self.burst
+        self.max_items = max_items
+        self.dt = 1000.0 / Config.SIM_HZ
+        self.step_scale = self.dt / Config.SPEED_REF_MS
+        
+        self.bin_top = Config.SCREEN_HEIGHT - Config.BIN_FLOOR_GAP - Config.BIN_SIZE
+        
+        n, m = num_envs, max_items
+        self.bin_x = np.zeros(n, dtype=np.float64)
+        self.bin_type = np.zeros(n, dtype=np.int8)
+        self.health = np.zeros(n, dtype=np.int16)
+        self.now = np.zeros(n, dtype=np.float64)
+        self.next_swap = np.zeros(n, dtype=np.float64)
+        self.next_spawn = np.zeros(n, dtype=np.float64)
+        self.spawned = np.zeros(n, dtype=np.int32)
+        self.caught = np.zeros(n, dtype=np.int32)
+        self.scored = np.zeros(n, dtype=np.int32)
+        
+        self.trash_x = np.zeros((n, m), dtype=np.int32)
+        self.trash_y = np.zeros((n, m), dtype=np.float64)
+        self.trash_speed = np.zeros((n, m), dtype=np.float64)
+        self.trash_type = np.zeros((n, m), dtype=np.int8)
+        
+        self.rng = np.random.default_rng()
+    
+    def reset(self, seed=None):
+        """Reset every game; returns the first observation"""
+        self.rng = np.random.default_rng(seed)
+        self._reset_envs(np.arange(self.num_envs))
+        return self._observe()
+    
+    def _reset_envs(self, idx):
+        self.bin_x[idx] = Config.SCREEN_WIDTH // 2 - Config.BIN_SIZE // 2
+        self.bin_type[idx] = TrashType.ORGANIC.value
+        self.health[idx] = 3
+        self.now[idx] = 0
+        self.next_swap[idx] = 0
+        self.next_spawn[idx] = 0
+        self.spawned[idx] = 0
+        self.caught[idx] = 0
+        self.scored[idx] = 0
+        self.trash_type[idx] = self.EMPTY
+    
+    def _spawn(self, envs, counts):
+        """Drop up to counts[i] items in game envs[i], like a burst of Spawner
+        schedule entries; returns how many each game actually placed"""
+        # First free slots per game (free ones sort first); a full game places fewer
+        free = self.trash_type[envs] == self.EMPTY
+        slot = np.argsort(~free, axis=1, kind="stable")[:, :self.burst]
+        placed = np.take_along_axis(free, slot, axis=1)
+        placed &= np.arange(slot.shape[1]) < counts[:, None]
+        
+        shape = slot.shape
+        roll = self.rng.random(shape)
+        t_type = np.where(roll < self.BONUS_CHANCE, TrashType.BONUS.value,
+                          np.where(roll < self.ORGANIC_CHANCE, TrashType.ORGANIC.value,
+                                   TrashType.INORGANIC.value))
+        speed = self.speed * self.rng.uniform(0.9, 1.1, shape)
+        x = self.rng.integers(50, Config.SCREEN_WIDTH - 50 + 1, shape)
+        
+        rows = np.broadcast_to(envs[:, None], shape)[placed]
+        slot = slot[placed]
+        self.trash_type[rows, slot] = t_type[placed]
+        self.trash_x[rows, slot] = x[placed]
+        self.trash_y[rows, slot] = -50
+        self.trash_speed[rows, slot] = speed[placed]
+        return placed.sum(axis=1)
+    
+    def step(self, actions):
+        """Advance every game one fixed step; returns (obs, rewards, dones, info)"""
+        actions = np.asarray(actions)
+        
+        # Swap is handled on key press, before the update
+        swap = self.SWAP[actions] & (self.now >= self.next_swap)
+        self.bin_type[swap] = (TrashType.ORGANIC.value + TrashType.INORGANIC.value) - self.bin_type[swap]
+        self.next_swap[swap] = self.now[swap] + Config.SWAP_COOLDOWN
+        
+        # Player movement
+        move = self.MOVE[actions] * (Config.PLAYER_SPEED * self.step_scale)
+        np.clip(self.bin_x + move, 0, Config.SCREEN_WIDTH - Config.BIN_SIZE, out=self.bin_x)
+        
+        # Spawner
+        due = (self.spawned < self.total) & (self.now >= self.next_spawn)
+        if due.any():
+            envs = np.nonzero(due)[0]
+            counts = np.minimum(self.burst, self.total - self.spawned[envs])
+            placed = self._spawn(envs, counts)
+            self.spawned[envs] += placed
+            
+            # A burst cut short by a full game resumes on the next step
+            done = envs[placed == counts]
+            self.next_spawn[done] = self.now[done] + self.interval
+        
+        # Falling trash (rects truncate toward zero like int())
+        alive = self.trash_type != self.EMPTY
+        self.trash_y += self.trash_speed * self.step_scale
+        top = np.trunc(self.trash_y)
+        
+        # Bin overlap and lid entry
+        size = Config.TRASH_SIZE
+        bx = np.floor(self.bin_x)[:, None]
+        hit = (alive & (self.trash_x < bx + Config.BIN_SIZE) & (bx < self.trash_x + size)
+               & (top < self.bin_top + Config.BIN_SIZE) & (self.bin_top < top + size))
+        lid = hit & (top + size <= self.bin_top + Config.LID_DEPTH)
+        bonus = self.trash_type == TrashType.BONUS.value
+        match = self.trash_type == self.bin_type[:, None]
+        missed = alive & ~hit & (top > Config.SCREEN_HEIGHT)
+        
+        caught = (lid & match).sum(axis=1)
+        healed = (lid & bonus).sum(axis=1)
+        damage = ((hit & ~bonus & ~(lid & match)) | (missed & ~bonus)).sum(axis=1)
+        
+        self.caught += caught
+        self.scored += ((hit | missed) & ~bonus).sum(axis=1)
+        if self.damage:
+            self.health += (healed - damage).astype(np.int16)
+        else:
+            self.health += healed.astype(np.int16)
+        self.trash_type[hit | missed] = self.EMPTY
+        self.now += self.dt
+        
+        # Game over / level complete
+        lost = self.health <= 0
+        won = ~lost & (self.spawned >= self.total) & ~(self.trash_type != self.EMPTY).any(axis=1)
+        dones = lost | won
+        
+        info = {"won": won, "caught": self.caught.copy(), "total": self.scored.copy()}
+        rewards = (caught - damage).astype(np.float32)
+        if dones.any():
+            self._reset_envs(np.nonzero(dones)[0])
+        return self._observe(), rewards, dones, info
+    
+    def _observe(self):
+        return {
+            "trash_x": self.trash_x.astype(np.float32),
+            "trash_y": np.trunc(self.trash_y).astype(np.float32),
+            "trash_type": self.trash_type.copy(),
+            "bin_x": np.floor(self.bin_x).astype(np.float32),
+            "bin_type": self.bin_type.copy(),
+            "health": self.health.copy()
+        }
\ No newline at end of file